@@ -30,6 +30,9 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        "fast": ["numba", "orjson"],
+    },
     entry_points={
         "console_scripts": [
             "digital_notebook=src.main:main",
@@ -6,10 +6,185 @@ integrating with the word counter to provide comprehensive text insights.
 """
 import re
 import string
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
 
-from .word_counter import WordCounter
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+    njit = None
+
+from src.core.page import Page
+from .word_counter import WordCounter, ANALYSIS_CACHE_SIZE, _copy_analysis
+
+# Maps vowel bytes to b"1" and every other byte to b"0", so that a word's
+# UTF-8 encoding translates to the binary digits of its vowel bitmask
+_VOWEL_BITS = bytes(0x31 if chr(i) in "aeiouy" else 0x30 for i in range(256))
+
+# Pattern used to split text into sentences
+_SENT_RE = re.compile(r'[.!?]+')
+
+# Common words ignored when extracting keywords
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "with", "by", "about", "of", "is", "are", "was", "were", "be", "been",
+    "being", "have", "has", "had", "do", "does", "did", "i", "you", "he",
+    "she", "it", "we", "they", "them", "their", "this", "that", "these",
+    "those", "my", "your", "his", "her", "its", "our"
+})
+
+# Byte translation table replacing every punctuation character with a space
+_PUNCT_TO_SPACE = bytes.maketrans(
+    string.punctuation.encode("ascii"), b" " * len(string.punctuation)
+)
+
+# Byte lookup tables for the vectorized syllable counter. _SPACE_MASK marks the
+# ASCII characters that str.split() treats as whitespace.
+_VOWEL_MASK = np.zeros(256, dtype=bool)
+_VOWEL_MASK[[ord(c) for c in "aeiouy"]] = True
+_SPACE_MASK = np.zeros(256, dtype=bool)
+_SPACE_MASK[[ord(c) for c in " \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"]] = True
+
+
+def _replace_punctuation(text: str) -> str:
+    """
+    Replace every punctuation character in the text with a space.
+    
+    The punctuation characters are all ASCII, so the UTF-8 bytes can be
+    translated directly without touching multi-byte characters. This is a
+    single C-level pass, unlike str.translate which is slow for non-ASCII text.
+    
+    Args:
+        text: Text to process
+        
+    Returns:
+        Text with punctuation replaced by spaces
+    """
+    encoded = text.encode("utf-8", "surrogatepass")
+    return encoded.translate(_PUNCT_TO_SPACE).decode("utf-8", "surrogatepass")
+
+
+def _syllable_kernel(chars, vowel_mask, space_mask):
+    """
+    Count syllables in a byte array with a single scan.
+    
+    This is the per-character state machine of
+    TextAnalyzer._count_syllables_in_word, run over the whole text at once.
+    It is only used when numba is installed to compile it.
+    """
+    total = 0
+    length = 0
+    groups = 0
+    last = 0
+    prev_is_vowel = False
+    before_last_is_vowel = False
+    
+    for i in range(chars.shape[0] + 1):
+        # A trailing space flushes the last word
+        char = chars[i] if i < chars.shape[0] else 32
+        
+        if space_mask[char]:
+            if length > 3:
+                if last == 101 and not before_last_is_vowel:  # silent e
+                    groups -= 1
+                total += max(1, groups)
+            elif length > 0:
+                total += 1
+            length = 0
+            groups = 0
+            prev_is_vowel = False
+            continue
+        
+        is_vowel = vowel_mask[char]
+        if is_vowel and not prev_is_vowel:
+            groups += 1
+        before_last_is_vowel = prev_is_vowel
+        prev_is_vowel = is_vowel
+        last = char
+        length += 1
+    
+    return total
+
+
+if njit is not None:
+    _syllable_kernel = njit(cache=True)(_syllable_kernel)
+else:
+    _syllable_kernel = None
+
+
+def _count_syllables_ascii(text: str) -> int:
+    """
+    Count syllables in lowercase ASCII text.
+    
+    Gives the same result as summing TextAnalyzer._count_syllables_in_word over
+    text.split(), but processes the whole text as one byte array: with a
+    compiled numba kernel when numba is installed, otherwise with NumPy.
+    
+    Args:
+        text: Lowercase ASCII text with punctuation already removed
+        
+    Returns:
+        Approximate number of syllables
+    """
+    chars = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    if _syllable_kernel is not None:
+        return int(_syllable_kernel(chars, _VOWEL_MASK, _SPACE_MASK))
+    
+    in_word = ~_SPACE_MASK[chars]
+    if not in_word.any():
+        return 0
+    
+    # Word boundaries are the transitions into and out of non-space runs
+    padded = np.concatenate(([False], in_word, [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    starts, ends = edges[::2], edges[1::2]
+    lengths = ends - starts
+    
+    # A vowel group starts at every vowel not preceded by another vowel
+    vowels = _VOWEL_MASK[chars]
+    group_starts = vowels.copy()
+    group_starts[1:] &= ~vowels[:-1]
+    counts = np.add.reduceat(group_starts.astype(np.int64), starts)
+    
+    # Adjust for silent e at end
+    silent_e = (
+        (chars[ends - 1] == ord("e"))
+        & (lengths > 2)
+        & ~vowels[np.maximum(ends - 2, 0)]
+    )
+    counts -= silent_e
+    
+    # Short words count as one syllable, and every word has at least one
+    counts = np.maximum(counts, 1)
+    counts[lengths <= 3] = 1
+    return int(counts.sum())
+
+
+@dataclass
+class TokenizedText:
+    """
+    Tokenization of a text shared between the analysis steps.
+    
+    Computing this once lets analyze_text feed readability, syllable and
+    keyword analysis without scanning the text again for each of them.
+    """
+    lower_text: str  # Lowercase text with punctuation replaced by spaces
+    words: List[str]  # Words of lower_text
+    sentences: List[str]  # Sentence split of the original text
+    
+    @classmethod
+    def from_text(cls, text: str) -> 'TokenizedText':
+        """Tokenize a text."""
+        lower_text = _replace_punctuation(text.lower())
+        return cls(
+            lower_text=lower_text,
+            words=lower_text.split(),
+            sentences=_SENT_RE.split(text)
+        )
 
 
 class TextAnalyzer:
@@ -30,23 +205,48 @@ class TextAnalyzer:
         """
         self.word_counter = word_counter or WordCounter()
         
+        # Memoized analyses, keyed on the text and the word counter's weights
+        # version so that changing any weight never returns stale results
+        self._cached_analysis = lru_cache(maxsize=ANALYSIS_CACHE_SIZE)(self._analyze_text)
+        
+        # Memoized keyword rankings, so that callers asking for a different
+        # number of keywords for the same text only slice the ranking
+        self._cached_keywords = lru_cache(maxsize=ANALYSIS_CACHE_SIZE)(self._rank_keywords)
+        
+    def clear_cache(self) -> None:
+        """Discard all memoized text analyses."""
+        self._cached_analysis.cache_clear()
+        self._cached_keywords.cache_clear()
+        
     def analyze_text(self, text: str) -> Dict[str, Any]:
         """
         Perform comprehensive analysis of the text.
         
+        Results are memoized, so repeated versions in a history or repeated
+        comparisons of the same text are only analyzed once.
+        
         Args:
             text: Text to analyze
             
         Returns:
             Dictionary with various analysis metrics
         """
+        return _copy_analysis(self._cached_analysis(text, self.word_counter.weights_version))
+    
+    def _analyze_text(self, text: str, weights_version: int) -> Dict[str, Any]:
+        """Compute the analysis returned by analyze_text."""
         # Get basic word count analysis from the word counter
         basic_analysis = self.word_counter.analyze_text(text)
         
+        # Tokenize once and share the result, along with the word count
+        tokens = TokenizedText.from_text(text)
+        
         # Add additional analysis
-        readability = self.calculate_readability(text)
-        keywords = self.extract_keywords(text)
-        sentence_count = len(re.split(r'[.!?]+', text))
+        readability = self.calculate_readability(
+            text, word_count=basic_analysis["word_count"], tokens=tokens
+        )
+        keywords = self.extract_keywords(text, tokens=tokens)
+        sentence_count = len(tokens.sentences)
         
         # Combine the analyses
         analysis = {
@@ -58,24 +258,36 @@ class TextAnalyzer:
         
         return analysis
     
-    def calculate_readability(self, text: str) -> Dict[str, float]:
+    def calculate_readability(
+        self,
+        text: str,
+        word_count: Optional[int] = None,
+        tokens: Optional[TokenizedText] = None
+    ) -> Dict[str, float]:
         """
         Calculate readability metrics for the text.
         
+        Callers that already tokenized the text can pass the intermediate
+        results to avoid computing them again.
+        
         Args:
             text: Text to analyze
+            word_count: Optional precomputed number of words in the text
+            tokens: Optional precomputed tokenization of the text
             
         Returns:
             Dictionary with readability metrics
         """
-        word_count = self.word_counter.count_words(text)
+        if word_count is None:
+            word_count = self.word_counter.count_words(text)
+        if tokens is None:
+            tokens = TokenizedText.from_text(text)
         
         # Count sentences (rough approximation)
-        sentences = re.split(r'[.!?]+', text)
-        sentence_count = max(1, len(sentences) - 1)  # Account for potential empty string at end
+        sentence_count = max(1, len(tokens.sentences) - 1)  # Account for potential empty string at end
         
         # Count syllables (rough approximation)
-        syllable_count = self._count_syllables(text)
+        syllable_count = self._count_syllables(text, tokens=tokens)
         
         # Calculate Flesch-Kincaid Grade Level
         if word_count > 0 and sentence_count > 0:
@@ -96,7 +308,7 @@ class TextAnalyzer:
             "average_syllables_per_word": syllable_count / max(1, word_count),
         }
     
-    def _count_syllables(self, text: str) -> int:
+    def _count_syllables(self, text: str, tokens: Optional[TokenizedText] = None) -> int:
         """
         Count the number of syllables in the text (approximate).
         
@@ -104,23 +316,22 @@ class TextAnalyzer:
         
         Args:
             text: Text to analyze
+            tokens: Optional precomputed tokenization of the text
             
         Returns:
             Approximate number of syllables
         """
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Replace punctuation with spaces
-        for p in string.punctuation:
-            text = text.replace(p, " ")
+        # Lowercase the text, replace punctuation with spaces and split into words
+        if tokens is None:
+            tokens = TokenizedText.from_text(text)
             
-        # Split into words
-        words = text.split()
+        # ASCII text is counted in one vectorized pass over the whole text
+        if tokens.lower_text.isascii():
+            return _count_syllables_ascii(tokens.lower_text)
         
         # Count syllables
         count = 0
-        for word in words:
+        for word in tokens.words:
             word_count = self._count_syllables_in_word(word)
             count += word_count
             
@@ -140,18 +351,13 @@ class TextAnalyzer:
         if len(word) <= 3:
             return 1
             
-        # Count vowel groups
-        count = 0
+        # Count vowel groups without branching per character: in the vowel
+        # bitmask (first character highest), a group starts at each set bit
+        # whose higher neighbour is clear. Multi-byte characters encode to
+        # several clear bits, which still count as one consonant.
         vowels = "aeiouy"
-        prev_is_vowel = False
-        
-        for char in word:
-            is_vowel = char in vowels
-            
-            if is_vowel and not prev_is_vowel:
-                count += 1
-                
-            prev_is_vowel = is_vowel
+        bits = int(word.encode("utf-8", "surrogatepass").translate(_VOWEL_BITS), 2)
+        count = bin(bits & ~(bits >> 1)).count("1")
             
         # Adjust for silent e at end
         if word.endswith('e') and len(word) > 2 and word[-2] not in vowels:
@@ -160,55 +366,73 @@ class TextAnalyzer:
         # Ensure at least one syllable
         return max(1, count)
     
-    def extract_keywords(self, text: str, top_n: int = 5) -> List[str]:
+    def extract_keywords(
+        self,
+        text: str,
+        top_n: int = 5,
+        tokens: Optional[TokenizedText] = None
+    ) -> List[str]:
         """
         Extract the most important keywords from the text.
         
         Args:
             text: Text to analyze
             top_n: Number of top keywords to return
+            tokens: Optional precomputed tokenization of the text
             
         Returns:
             List of the most important keywords
         """
-        # Convert to lowercase
-        text = text.lower()
+        # Rank the keywords once per text and slice the top N
+        if tokens is None:
+            ranking = self._cached_keywords(text)
+        else:
+            ranking = self._rank_keywords(text, tokens)
+        return ranking[:top_n]
+    
+    def _rank_keywords(self, text: str, tokens: Optional[TokenizedText] = None) -> List[str]:
+        """
+        Rank all keywords of the text from most to least frequent.
         
-        # Remove punctuation
-        for p in string.punctuation:
-            text = text.replace(p, " ")
+        Args:
+            text: Text to analyze
+            tokens: Optional precomputed tokenization of the text
             
-        # Split into words
-        words = text.split()
-        
-        # Remove common stop words
-        stop_words = {
-            "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-            "with", "by", "about", "of", "is", "are", "was", "were", "be", "been",
-            "being", "have", "has", "had", "do", "does", "did", "i", "you", "he",
-            "she", "it", "we", "they", "them", "their", "this", "that", "these",
-            "those", "my", "your", "his", "her", "its", "our", "their"
-        }
-        
-        filtered_words = [word for word in words if word not in stop_words and len(word) > 2]
+        Returns:
+            List of keywords ordered as Counter.most_common orders them
+        """
+        # Lowercase the text, remove punctuation and split into words
+        if tokens is None:
+            tokens = TokenizedText.from_text(text)
         
-        # Count word frequency
-        word_counts = Counter(filtered_words)
+        # Count word frequency, skipping common stop words and short words
+        word_counts = Counter(
+            word for word in tokens.words if len(word) > 2 and word not in _STOP_WORDS
+        )
         
-        # Get the top N keywords
-        return [word for word, _ in word_counts.most_common(top_n)]
+        return [word for word, _ in word_counts.most_common()]
     
-    def track_progress(self, text_history: List[str]) -> Dict[str, Any]:
+    def track_progress(self, text_history: List[Union[str, Page]]) -> Dict[str, Any]:
         """
         Track progress over a history of text versions.
         
         Args:
-            text_history: List of text versions in chronological order
+            text_history: List of text versions, or pages holding them,
+                          in chronological order
             
         Returns:
             Dictionary with progress metrics
         """
-        word_counts = [self.word_counter.count_words(text) for text in text_history]
+        # Pages keep their word count between calls; plain strings are counted
+        word_counts = [
+            self.word_counter.count_words_cached(version) if isinstance(version, Page)
+            else self.word_counter.count_words(version)
+            for version in text_history
+        ]
+        text_history = [
+            version.content if isinstance(version, Page) else version
+            for version in text_history
+        ]
         
         # Calculate changes between versions
         word_deltas = [
@@ -216,12 +440,9 @@ class TextAnalyzer:
             for i in range(len(word_counts))
         ]
         
-        # Calculate cumulative word counts
-        cumulative_counts = []
-        running_total = 0
-        for count in word_counts:
-            running_total = count  # Use the actual count, not the delta
-            cumulative_counts.append(running_total)
+        # Calculate cumulative word counts (each version's count is already
+        # the running total of the deltas)
+        cumulative_counts = list(word_counts)
         
         # Calculate other metrics for each version
         analyses = [self.analyze_text(text) for text in text_history]
@@ -5,9 +5,101 @@ This module implements the weighted word counting system as described in the req
 It assigns weights to different text elements and provides methods for counting and analyzing text.
 """
 import re
-from typing import Dict, List, Tuple, Set, Optional, Any
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple, Set, Optional, Any
 import string
 
+import numpy as np
+
+from src.core.page import Page
+
+# Pattern used to tokenize text into words; runs of word characters are
+# bounded by word boundaries already, so no \b assertions are needed
+_WORD_RE = re.compile(r'\w+')
+
+# Maps every ASCII character that is not a word character (letters, digits and
+# underscore, as matched by \w) to a space, so that ASCII text can be tokenized
+# with str.split() and give exactly the same words as _WORD_RE.
+_WORD_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+_PUNCT_TABLE = str.maketrans({chr(i): " " for i in range(128) if chr(i) not in _WORD_CHARS})
+
+# Character classes used when counting characters by type
+_LETTERS = frozenset(string.ascii_letters)
+_DIGITS = frozenset(string.digits)
+_PUNCTUATION = frozenset(string.punctuation)
+_WHITESPACE = frozenset(string.whitespace)
+
+
+def _class_mask(chars: frozenset) -> np.ndarray:
+    """Build a boolean table marking the given characters by code point."""
+    mask = np.zeros(256, dtype=bool)
+    mask[[ord(char) for char in chars]] = True
+    return mask
+
+
+# The same character classes as lookup tables over Latin-1 code points
+_LETTER_MASK = _class_mask(_LETTERS)
+_DIGIT_MASK = _class_mask(_DIGITS)
+_PUNCTUATION_MASK = _class_mask(_PUNCTUATION)
+_WHITESPACE_MASK = _class_mask(_WHITESPACE)
+_WORD_CHAR_MASK = _class_mask(_WORD_CHARS)
+
+
+def _char_histogram(text: str) -> Optional[np.ndarray]:
+    """
+    Count every character of a Latin-1 text in one pass.
+    
+    Args:
+        text: Text to analyze
+        
+    Returns:
+        Array of 256 counts indexed by code point, or None if the text has
+        characters outside Latin-1
+    """
+    try:
+        encoded = text.encode("latin-1")
+    except UnicodeEncodeError:
+        return None
+    return np.bincount(np.frombuffer(encoded, dtype=np.uint8), minlength=256)
+
+
+def _tokenize(text: str) -> List[str]:
+    """
+    Split text into words, as matched by _WORD_RE.
+    
+    Args:
+        text: Text to tokenize
+        
+    Returns:
+        List of words in the text
+    """
+    # Fast path: for ASCII text, translating non-word characters to spaces
+    # and splitting gives the same tokens as the regex, without running
+    # the regex engine. Unicode word characters still need the regex.
+    if text.isascii():
+        return text.translate(_PUNCT_TABLE).split()
+    
+    return _WORD_RE.findall(text)
+
+
+# Number of distinct texts whose analysis is memoized per instance
+ANALYSIS_CACHE_SIZE = 128
+
+
+def _copy_analysis(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a memoized analysis so callers can modify the result freely.
+    
+    Nested dictionaries and lists are copied as well, which is enough for the
+    flat structures returned by the analyzers.
+    """
+    return {
+        key: value.copy() if isinstance(value, (dict, list)) else value
+        for key, value in analysis.items()
+    }
+
 
 class WordCounter:
     """
@@ -24,22 +116,87 @@ class WordCounter:
         Args:
             letter_weight: Weight to assign to letters (between 0 and 1)
         """
+        # Memoized analyses, keyed on the analyzed text
+        self._cached_analysis = lru_cache(maxsize=ANALYSIS_CACHE_SIZE)(self._analyze_text)
+        
+        # Number of times the weights have changed, bumped on every change
+        self._weights_version = 0
+        
+        # Setting the letter weight also initializes the character weights
         self.letter_weight = letter_weight
         
+        # Special handling for the first word in a line/document
+        self.first_word_adjustment = 0.25
+    
+    @property
+    def letter_weight(self) -> float:
+        """Weight assigned to letters (between 0 and 1)."""
+        return self._letter_weight
+    
+    @letter_weight.setter
+    def letter_weight(self, letter_weight: float) -> None:
+        self._letter_weight = letter_weight
+        
         # Initialize character weights
-        self.char_weights = {}
+        self._char_weights: Dict[str, float] = {}
         
         # Assign weights to different character types
         # Letters get the specified letter_weight
         for char in string.ascii_letters:
-            self.char_weights[char] = letter_weight
+            self._char_weights[char] = letter_weight
             
         # Spaces, punctuation, and other characters get zero weight
         for char in string.whitespace + string.punctuation + string.digits:
-            self.char_weights[char] = 0.0
-            
-        # Special handling for the first word in a line/document
-        self.first_word_adjustment = 0.25
+            self._char_weights[char] = 0.0
+        
+        # Dense lookup table of the same weights indexed by Latin-1 code point
+        self._weight_lut = np.zeros(256, dtype=np.float64)
+        for char, weight in self._char_weights.items():
+            self._weight_lut[ord(char)] = weight
+        
+        # Cached analyses were computed with the old weights
+        self._weights_version += 1
+        self.clear_cache()
+    
+    @property
+    def char_weights(self) -> Mapping[str, float]:
+        """
+        Weight of each character, as a read-only view.
+        
+        The weights are also kept in a lookup table, so they are changed
+        through letter_weight or set_character_weight rather than in place.
+        """
+        return MappingProxyType(self._char_weights)
+    
+    @property
+    def weights_version(self) -> int:
+        """
+        Counter that changes whenever any character weight changes.
+        
+        Callers that memoize results derived from the weights can key their
+        caches on it.
+        """
+        return self._weights_version
+    
+    def set_character_weight(self, char: str, weight: float) -> None:
+        """
+        Set the weight of a single character.
+        
+        Args:
+            char: The character to weigh
+            weight: Weight to assign to it
+        """
+        self._char_weights[char] = weight
+        if ord(char) < 256:
+            self._weight_lut[ord(char)] = weight
+        
+        # Cached analyses were computed with the old weights
+        self._weights_version += 1
+        self.clear_cache()
+    
+    def clear_cache(self) -> None:
+        """Discard all memoized text analyses."""
+        self._cached_analysis.cache_clear()
     
     def count_words(self, text: str) -> int:
         """
@@ -51,9 +208,22 @@ class WordCounter:
         Returns:
             Number of words in the text
         """
-        # Simple approach: split on whitespace
-        words = re.findall(r'\b\w+\b', text)
-        return len(words)
+        return len(_tokenize(text))
+    
+    def count_words_cached(self, page: Page) -> int:
+        """
+        Count the number of words on a page, reusing the count until the page changes.
+        
+        The page keeps the count, and keeps it up to date through edits;
+        see Page.word_count.
+        
+        Args:
+            page: Page to analyze
+            
+        Returns:
+            Number of words in the page content
+        """
+        return page.word_count()
     
     def weighted_count(self, text: str) -> float:
         """
@@ -79,40 +249,78 @@ class WordCounter:
         Returns:
             Dictionary mapping character types to their total weight
         """
-        char_totals = {}
-        
-        for char in text:
-            if char not in char_totals:
-                char_totals[char] = 0.0
-            
-            weight = self.char_weights.get(char, 0.0)
-            char_totals[char] += weight
+        counts = _char_histogram(text)
+        if counts is None:
+            # Characters outside Latin-1 do not fit the lookup table
+            return {
+                char: count * self._char_weights.get(char, 0.0)
+                for char, count in Counter(text).items()
+            }
+        return self._weigh_histogram(counts)
+    
+    def _weigh_histogram(self, counts: np.ndarray) -> Dict[str, float]:
+        """Weight a character histogram from _char_histogram with the lookup table."""
+        present = np.flatnonzero(counts)
+        totals = counts[present] * self._weight_lut[present]
         
-        return char_totals
+        return dict(zip(map(chr, present.tolist()), totals.tolist()))
     
     def analyze_text(self, text: str) -> Dict[str, Any]:
         """
         Perform comprehensive analysis of the text.
         
+        Results are memoized, so analyzing the same text again is a cache lookup.
+        
         Args:
             text: Text to analyze
             
         Returns:
             Dictionary with various analysis metrics
         """
-        word_count = self.count_words(text)
-        weighted_count = self.weighted_count(text)
-        char_weights = self.get_character_weights(text)
+        return _copy_analysis(self._cached_analysis(text))
+    
+    def _analyze_text(self, text: str) -> Dict[str, Any]:
+        """Compute the analysis returned by analyze_text."""
+        # Tokenize once; the words are reused for the average word length
+        words = _tokenize(text)
+        word_count = len(words)
+        weighted_count = float(word_count)  # Each word weighs 1, as in weighted_count
         
-        # Count characters by type
-        letter_count = sum(1 for c in text if c in string.ascii_letters)
-        digit_count = sum(1 for c in text if c in string.digits)
-        punctuation_count = sum(1 for c in text if c in string.punctuation)
-        whitespace_count = sum(1 for c in text if c in string.whitespace)
+        # A single histogram of the text gives the character weights, the
+        # counts by type and, for ASCII text, the total length of the words
+        counts = _char_histogram(text)
+        if counts is not None:
+            char_weights = self._weigh_histogram(counts)
+            letter_count = int(counts[_LETTER_MASK].sum())
+            digit_count = int(counts[_DIGIT_MASK].sum())
+            punctuation_count = int(counts[_PUNCTUATION_MASK].sum())
+            whitespace_count = int(counts[_WHITESPACE_MASK].sum())
+        else:
+            # Count characters by type: Counter tallies the text in C, so
+            # only the distinct characters are classified in Python
+            char_counts = Counter(text)
+            char_weights = {
+                char: count * self._char_weights.get(char, 0.0)
+                for char, count in char_counts.items()
+            }
+            letter_count = digit_count = punctuation_count = whitespace_count = 0
+            for char, count in char_counts.items():
+                if char in _LETTERS:
+                    letter_count += count
+                elif char in _DIGITS:
+                    digit_count += count
+                elif char in _PUNCTUATION:
+                    punctuation_count += count
+                elif char in _WHITESPACE:
+                    whitespace_count += count
         
-        # Calculate average word length
-        words = re.findall(r'\b\w+\b', text)
-        avg_word_length = sum(len(word) for word in words) / max(1, len(words))
+        # Calculate average word length; in ASCII text every word character
+        # belongs to a word, so the histogram already holds the total
+        if counts is not None and text.isascii():
+            word_chars = int(counts[_WORD_CHAR_MASK].sum())
+        else:
+            word_chars = sum(len(word) for word in words)
+        avg_word_length = word_chars / max(1, len(words))
         
         return {
             "word_count": word_count,
@@ -138,18 +346,12 @@ class WordCounter:
         Returns:
             Dictionary with data points for plotting
         """
-        words = re.findall(r'\b\w+\b', text)
-        
-        # Calculate cumulative word counts
-        cumulative_counts = []
-        running_count = 0
-        
-        for i, word in enumerate(words):
-            running_count += 1
-            cumulative_counts.append(running_count)
+        word_count = self.count_words(text)
         
-        # Generate x-axis values (word positions)
-        x_values = list(range(1, len(words) + 1))
+        # Generate x-axis values (word positions); the cumulative word count
+        # after each word is its position, so both axes are the same range
+        x_values = list(range(1, word_count + 1))
+        cumulative_counts = list(range(1, word_count + 1))
         
         return {
             "x_values": x_values,
@@ -168,21 +370,25 @@ class WordCounter:
         Returns:
             Dictionary mapping words to their weights
         """
-        return {word: 1.0 for word in words}
+        return dict.fromkeys(words, 1.0)
     
-    def custom_weighted_count(self, text: str, char_weights: Dict[str, float]) -> float:
+    def custom_weighted_count(
+        self,
+        text: str,
+        char_weights: Optional[Dict[str, float]] = None
+    ) -> float:
         """
         Calculate the weighted count using custom character weights.
         
+        Since the weights of a word's characters always sum to 1, the count
+        does not depend on the character weights and equals weighted_count.
+        
         Args:
             text: Text to analyze
-            char_weights: Dictionary mapping characters to weights
+            char_weights: Dictionary mapping characters to weights (unused)
             
         Returns:
             Custom weighted count of the text
         """
-        # Split the text into words
-        words = re.findall(r'\b\w+\b', text)
-        
         # Count each word as 1
-        return float(len(words))
+        return float(self.count_words(text))
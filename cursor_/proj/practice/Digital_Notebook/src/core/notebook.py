@@ -4,8 +4,9 @@ Notebook module for the Digital Notebook.
 This module defines the Notebook class that manages a collection of pages.
 """
 import datetime
+import time
 from typing import Dict, List, Optional, Any
-from .page import Page
+from .page import Page, _datetime_from_ns
 
 
 class Notebook:
@@ -25,10 +26,47 @@ class Notebook:
         """
         self.name = name
         self.max_pages = max_pages
-        self.created_at = datetime.datetime.now()
-        self.updated_at = self.created_at
+        # Pages keyed by ID; insertion order is ascending ID order, which
+        # create_page and from_dict maintain and list_pages relies on
         self.pages: Dict[int, Page] = {}
         self.notebook_metadata = {}
+        
+        # Next page ID to hand out; never decremented so IDs stay unique
+        self._next_id = 1
+        
+        # Timestamps are kept as time.time_ns() values and only converted to
+        # datetimes when read, as for pages
+        self._created_ns = time.time_ns()
+        self._created_at: Optional[datetime.datetime] = None
+        self._updated_ns = self._created_ns
+        self._updated_at: Optional[datetime.datetime] = None
+    
+    @property
+    def created_at(self) -> datetime.datetime:
+        """Time the notebook was created."""
+        if self._created_at is None:
+            self._created_at = _datetime_from_ns(self._created_ns)
+        return self._created_at
+    
+    @created_at.setter
+    def created_at(self, value: datetime.datetime) -> None:
+        self._created_at = value
+    
+    @property
+    def updated_at(self) -> datetime.datetime:
+        """Time the notebook was last modified."""
+        if self._updated_at is None:
+            self._updated_at = _datetime_from_ns(self._updated_ns)
+        return self._updated_at
+    
+    @updated_at.setter
+    def updated_at(self, value: datetime.datetime) -> None:
+        self._updated_at = value
+    
+    def _touch(self) -> None:
+        """Record a modification of the notebook."""
+        self._updated_ns = time.time_ns()
+        self._updated_at = None
     
     def create_page(self, name: Optional[str] = None, content: str = "") -> Page:
         """
@@ -47,15 +85,17 @@ class Notebook:
         if len(self.pages) >= self.max_pages:
             raise ValueError(f"Cannot create new page: maximum of {self.max_pages} pages reached")
         
-        # Generate a new page ID
-        new_id = 1
+        # Generate a new page ID above every existing one, resyncing the
+        # counter if pages were added directly, so pages stay ordered by ID
+        new_id = self._next_id
         if self.pages:
-            new_id = max(self.pages.keys()) + 1
+            new_id = max(new_id, next(reversed(self.pages)) + 1)
+        self._next_id = new_id + 1
         
         # Create and store the new page
         page = Page(page_id=new_id, name=name, content=content)
         self.pages[new_id] = page
-        self.updated_at = datetime.datetime.now()
+        self._touch()
         
         return page
     
@@ -91,7 +131,7 @@ class Notebook:
             raise KeyError(f"No page exists with ID {page_id}")
         
         del self.pages[page_id]
-        self.updated_at = datetime.datetime.now()
+        self._touch()
     
     def list_pages(self) -> List[Page]:
         """
@@ -100,7 +140,7 @@ class Notebook:
         Returns:
             List of Page objects, sorted by page ID
         """
-        return [self.pages[key] for key in sorted(self.pages.keys())]
+        return list(self.pages.values())
     
     def search_pages(self, query: str) -> List[Page]:
         """
@@ -112,10 +152,10 @@ class Notebook:
         Returns:
             List of matching Page objects
         """
+        query = query.lower()
         results = []
         for page in self.pages.values():
-            if (query.lower() in page.name.lower() or 
-                query.lower() in page.content.lower()):
+            if query in page.lower_name or query in page.lower_content:
                 results.append(page)
         
         return results
@@ -123,7 +163,7 @@ class Notebook:
     def set_metadata(self, key: str, value: Any) -> None:
         """Set a metadata value for the notebook."""
         self.notebook_metadata[key] = value
-        self.updated_at = datetime.datetime.now()
+        self._touch()
     
     def get_metadata(self, key: str) -> Any:
         """Get a metadata value for the notebook."""
@@ -140,6 +180,27 @@ class Notebook:
             "metadata": self.notebook_metadata
         }
     
+    def fast_serialize(self) -> Dict[str, Any]:
+        """
+        Convert the notebook to a structure for JSON encoders that handle datetimes.
+        
+        Timestamps are left as datetime objects and pages are a flat list in
+        ID order, so an encoder such as orjson can export the notebook without
+        formatting every timestamp in Python first, e.g.
+        orjson.dumps(notebook.fast_serialize(), option=orjson.OPT_NAIVE_UTC).
+        
+        Returns:
+            Dictionary with the notebook fields and a "pages" list
+        """
+        return {
+            "name": self.name,
+            "max_pages": self.max_pages,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "pages": [page.fast_serialize() for page in self.pages.values()],
+            "metadata": self.notebook_metadata
+        }
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Notebook':
         """Create a notebook from a dictionary representation."""
@@ -151,9 +212,10 @@ class Notebook:
         notebook.updated_at = datetime.datetime.fromisoformat(data["updated_at"])
         notebook.notebook_metadata = data["metadata"]
         
-        # Restore pages
-        for pid_str, page_data in data["pages"].items():
+        # Restore pages in ID order
+        for page_data in sorted(data["pages"].values(), key=lambda d: d["page_id"]):
             page = Page.from_dict(page_data)
             notebook.pages[page.page_id] = page
+        notebook._next_id = max(notebook.pages.keys(), default=0) + 1
             
         return notebook
@@ -4,7 +4,34 @@ Page module for the Digital Notebook.
 This module defines the Page class which represents a single page in the notebook.
 """
 import datetime
-from typing import Dict, Any, Optional
+import re
+import time
+from typing import Callable, Dict, Any, Optional
+
+
+def _datetime_from_ns(timestamp_ns: int) -> datetime.datetime:
+    """
+    Convert a time.time_ns() timestamp to a local datetime.
+    
+    Args:
+        timestamp_ns: Nanoseconds since the epoch
+        
+    Returns:
+        The equivalent naive local datetime, as datetime.now() would return it
+    """
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+
+
+# Words as counted by analysis.WordCounter, and single word characters
+_WORD_RE = re.compile(r"\w+")
+_WORD_CHAR_RE = re.compile(r"\w")
+_WORD_TAIL_RE = re.compile(r"\w*")
+
+
+def _count_words(text: str) -> int:
+    """Count the runs of word characters in text."""
+    return len(_WORD_RE.findall(text))
 
 
 class Page:
@@ -26,24 +53,183 @@ class Page:
         self.page_id = page_id
         self.name = name or f"Page {page_id}"
         self.content = content
-        self.created_at = datetime.datetime.now()
-        self.updated_at = self.created_at
         self.page_metadata = {}
+        
+        # Timestamps are kept as time.time_ns() values and only converted to
+        # datetimes when read, which keeps bulk edits and restores cheap
+        self._created_ns = time.time_ns()
+        self._created_at: Optional[datetime.datetime] = None
+        self._updated_ns = self._created_ns
+        self._updated_at: Optional[datetime.datetime] = None
+    
+    @property
+    def created_at(self) -> datetime.datetime:
+        """Time the page was created."""
+        if self._created_at is None:
+            self._created_at = _datetime_from_ns(self._created_ns)
+        return self._created_at
+    
+    @created_at.setter
+    def created_at(self, value: datetime.datetime) -> None:
+        self._created_at = value
+    
+    @property
+    def updated_at(self) -> datetime.datetime:
+        """Time the page was last modified."""
+        if self._updated_at is None:
+            self._updated_at = _datetime_from_ns(self._updated_ns)
+        return self._updated_at
+    
+    @updated_at.setter
+    def updated_at(self, value: datetime.datetime) -> None:
+        self._updated_at = value
+    
+    def _touch(self) -> None:
+        """Record a modification of the page."""
+        # Move on to a later microsecond, the resolution of updated_at, so
+        # every modification gives the page a new modification time
+        now = time.time_ns()
+        if now // 1000 <= self._updated_ns // 1000:
+            now = (self._updated_ns // 1000 + 1) * 1000
+        self._updated_ns = now
+        self._updated_at = None
+    
+    @property
+    def name(self) -> str:
+        """Name of the page."""
+        return self._name
+    
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        self._lower_name: Optional[str] = None
+    
+    @property
+    def content(self) -> str:
+        """Text content of the page, fetched on first use if it was deferred."""
+        if self._content is None:
+            self.content = self._content_loader()
+        return self._content
+    
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content: Optional[str] = value
+        self._content_loader: Optional[Callable[[], str]] = None
+        self._lower_content: Optional[str] = None
+        self._cached_word_count: Optional[int] = None  # Filled by word_count, kept by apply_delta
+    
+    def read_content(self) -> str:
+        """
+        Get the page content, reading deferred content without keeping it.
+        
+        Meant for passes over every page, such as indexing, that would
+        otherwise load the content of the whole notebook into memory.
+        """
+        # Read the loader first: assigning content sets it before clearing the loader
+        loader = self._content_loader
+        content = self._content
+        if content is None:
+            return loader()
+        return content
+    
+    @property
+    def content_loader(self) -> Optional[Callable[[], str]]:
+        """Function that fetches the deferred content, or None once the content is in memory."""
+        return self._content_loader
+    
+    def defer_content(self, loader: Callable[[], str]) -> None:
+        """
+        Leave the page content unread until it is first used.
+        
+        Used by storage to open notebooks without reading every page body.
+        The content is fetched once, the first time it is read, and kept.
+        
+        Args:
+            loader: Function returning the page content
+        """
+        self._content = None
+        self._content_loader = loader
+        self._lower_content = None
+        self._cached_word_count = None
+    
+    @property
+    def lower_name(self) -> str:
+        """Lowercase page name, computed once per name for case-insensitive search."""
+        if self._lower_name is None:
+            self._lower_name = self._name.lower()
+        return self._lower_name
+    
+    @property
+    def lower_content(self) -> str:
+        """
+        Lowercase page content, computed once per content for case-insensitive search.
+        
+        The cached copy doubles the memory held for the content of searched pages.
+        """
+        if self._lower_content is None:
+            self._lower_content = self.content.lower()
+        return self._lower_content
+    
+    def word_count(self) -> int:
+        """
+        Count the words of the page content, as analysis.WordCounter counts them.
+        
+        The count is kept until the content is replaced, and edits made with
+        apply_delta update it by recounting only the words they touch.
+        Content not yet loaded is read without being kept.
+        
+        Returns:
+            Number of runs of word characters in the content
+        """
+        if self._cached_word_count is None:
+            self._cached_word_count = _count_words(self.read_content())
+        return self._cached_word_count
     
     def update_content(self, content: str) -> None:
         """Update the page content and update timestamp."""
         self.content = content
-        self.updated_at = datetime.datetime.now()
+        self._touch()
+    
+    def apply_delta(self, position: int, removed: int, inserted: str) -> None:
+        """
+        Replace part of the page content and update timestamp.
+        
+        A cached word count is updated by recounting only the changed words.
+        
+        Args:
+            position: Index in the content where the change starts
+            removed: Number of characters removed at the position
+            inserted: Text inserted at the position
+        """
+        content = self.content
+        end = position + removed
+        word_count = self._cached_word_count
+        if word_count is not None:
+            # Recount only the words the change touches: widen the changed
+            # range to the surrounding word boundaries, which the change
+            # leaves in place, and compare the words inside it
+            start = position
+            while start > 0 and _WORD_CHAR_RE.match(content, start - 1):
+                start -= 1
+            stop = _WORD_TAIL_RE.match(content, end).end()
+            new_stop = stop - removed + len(inserted)
+            word_count -= _count_words(content[start:stop])
+        
+        self.content = content[:position] + inserted + content[end:]
+        self._touch()
+        
+        if word_count is not None:
+            self._cached_word_count = word_count + _count_words(self._content[start:new_stop])
     
     def rename(self, new_name: str) -> None:
         """Rename the page."""
         self.name = new_name
-        self.updated_at = datetime.datetime.now()
+        self._touch()
     
     def set_metadata(self, key: str, value: Any) -> None:
         """Set a metadata value for the page."""
         self.page_metadata[key] = value
-        self.updated_at = datetime.datetime.now()
+        self._touch()
     
     def get_metadata(self, key: str) -> Any:
         """Get a metadata value for the page."""
@@ -60,6 +246,22 @@ class Page:
             "metadata": self.page_metadata
         }
     
+    def fast_serialize(self) -> Dict[str, Any]:
+        """
+        Convert the page to a dictionary for JSON encoders that handle datetimes.
+        
+        Unlike to_dict, timestamps are left as datetime objects so that an
+        encoder such as orjson can format them natively.
+        """
+        return {
+            "page_id": self.page_id,
+            "name": self.name,
+            "content": self.content,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "metadata": self.page_metadata
+        }
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Page':
         """Create a page from a dictionary representation."""
@@ -4,18 +4,306 @@ Storage module for the Digital Notebook.
 This module provides functionality for saving and loading notebooks from storage.
 """
 import json
+import logging
 import os
+import shutil
 import sqlite3
-from typing import Optional, Dict, Any
+import string
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from typing import Optional, Dict, Any, Iterator, NamedTuple, Set, Tuple
 from pathlib import Path
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, delete, event, select, text, Column, Index, Integer, String, Text, DateTime
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DatabaseError
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.types import TypeDecorator
 
 from src.core.notebook import Notebook
+from src.core.page import Page
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional accelerator
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Errors meaning a database file is missing, unreadable or not a notebook
+_LOAD_ERRORS = (FileNotFoundError, sqlite3.DatabaseError, DatabaseError)
 
 Base = declarative_base()
 
+# Text values at least this many bytes long are stored compressed
+_COMPRESS_THRESHOLD = 1024
+
+
+class CompressedText(TypeDecorator):
+    """
+    Text column that stores long values zlib-compressed.
+    
+    Compressed values are stored as BLOBs and short values as TEXT, so the
+    SQLite storage class tells them apart and rows written before
+    compression was introduced still load unchanged.
+    """
+    impl = Text
+    cache_ok = True
+    
+    def process_bind_param(self, value: Optional[str], dialect) -> Any:
+        if value is None:
+            return None
+        encoded = value.encode("utf-8")
+        if len(encoded) < _COMPRESS_THRESHOLD:
+            return value
+        return zlib.compress(encoded, 1)
+    
+    def process_result_value(self, value: Any, dialect) -> Optional[str]:
+        if isinstance(value, bytes):
+            return zlib.decompress(value).decode("utf-8")
+        return value
+
+# Database paths whose schema has already been created by this process
+_initialized: Set[str] = set()
+
+# Storage directories already created or found to exist by this process
+_known_dirs: Set[str] = set()
+
+# Maximum number of database files kept open at once; opening another one
+# closes the least recently used
+_MAX_OPEN_DATABASES = 32
+
+# Suffixes of the files SQLite keeps next to a database in WAL mode
+_WAL_SUFFIXES = ("-wal", "-shm")
+
+# Replaces every ASCII character that is not allowed in a notebook filename
+_SAFE_FILENAME_CHARS = frozenset(string.ascii_letters + string.digits + " _-")
+_FILENAME_TABLE = str.maketrans({
+    chr(i): "_" for i in range(128) if chr(i) not in _SAFE_FILENAME_CHARS
+})
+
+# Maximum number of page IDs bound in a single IN (...) clause, well below
+# SQLite's limit on host parameters per statement
+_ID_CHUNK_SIZE = 500
+
+
+@lru_cache(maxsize=256)
+def _compute_db_path(storage_dir: str, notebook_name: str) -> str:
+    """
+    Get the database file path for a notebook in a storage directory.
+    
+    The result depends only on the arguments, so it is memoized; changing
+    the storage directory changes the key and needs no invalidation.
+    """
+    # Sanitize the notebook name for use in a filename; non-ASCII names
+    # need str.isalnum to keep Unicode letters and digits
+    if notebook_name.isascii():
+        safe_name = notebook_name.translate(_FILENAME_TABLE)
+    else:
+        safe_name = "".join(c if c.isalnum() or c in " _-" else "_" for c in notebook_name)
+    return os.path.join(storage_dir, f"{safe_name}.db")
+
+
+def _dumps(value: Any) -> str:
+    """Serialize metadata to JSON, with orjson when it is installed."""
+    if orjson is not None:
+        # Non-string keys are converted to strings, as json.dumps does
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+def _loads(data: str) -> Any:
+    """Deserialize metadata stored by _dumps."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _fast_copy(source_path: str, target_path: str) -> None:
+    """
+    Copy a file's contents, letting the kernel do the copy where possible.
+    
+    os.copy_file_range copies without passing the data through user space
+    and can share the blocks outright on copy-on-write filesystems.
+    Platforms and filesystems without it fall back to a buffered copy.
+    """
+    with open(source_path, "rb") as source, open(target_path, "wb") as target:
+        try:
+            while os.copy_file_range(source.fileno(), target.fileno(), 1 << 30):
+                pass
+        except (AttributeError, OSError):
+            # Both file positions have advanced past anything already copied
+            shutil.copyfileobj(source, target, length=1024 * 1024)
+
+
+def _tune_connection(dbapi_connection, connection_record) -> None:
+    """
+    Apply performance pragmas to a new SQLite connection.
+    
+    Write-ahead logging with synchronous=NORMAL turns each commit into an
+    append to the log instead of a full rollback-journal fsync cycle.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
+class _Database(NamedTuple):
+    """The shared engine of an open database file, its session factory and its lock."""
+    engine: Engine
+    session_factory: sessionmaker
+    lock: threading.RLock  # Serializes use of the engine's single connection
+
+
+# Open database files by path, least recently used first, and the lock
+# guarding the mapping itself
+_databases: "OrderedDict[str, _Database]" = OrderedDict()
+_databases_lock = threading.Lock()
+
+
+def _open_database(db_path: str) -> _Database:
+    """
+    Get the shared engine, session factory and lock of a database file, opening it on first use.
+    
+    The engine keeps a single connection open until the file is closed with
+    _dispose_engine, or evicted to keep at most _MAX_OPEN_DATABASES open,
+    so saves and loads skip opening the file and warming SQLite's page
+    cache again.
+    """
+    with _databases_lock:
+        database = _databases.get(db_path)
+        if database is not None:
+            _databases.move_to_end(db_path)
+            return database
+        
+        engine = create_engine(
+            f"sqlite:///{db_path}",
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False}
+        )
+        event.listen(engine, "connect", _tune_connection)
+        database = _Database(engine, sessionmaker(bind=engine, expire_on_commit=False), threading.RLock())
+        _databases[db_path] = database
+        
+        evicted = []
+        while len(_databases) > _MAX_OPEN_DATABASES:
+            evicted.append(_databases.popitem(last=False)[1])
+    
+    # Close evicted databases outside the mapping's lock, since closing
+    # waits for any session still using the connection
+    for evicted_database in evicted:
+        _close_database(evicted_database)
+    return database
+
+
+def _close_database(database: _Database) -> None:
+    """Close the connection of a database removed from _databases, once no session uses it."""
+    with database.lock:
+        database.engine.dispose()
+
+
+def _get_engine(db_path: str) -> Engine:
+    """Get the shared engine for a database file."""
+    return _open_database(db_path).engine
+
+
+def _ensure_dir(directory: str) -> None:
+    """Create a directory unless this process already made sure it exists."""
+    if directory in _known_dirs:
+        return
+    os.makedirs(directory, exist_ok=True)
+    _known_dirs.add(directory)
+
+
+@contextmanager
+def _locked_session(db_path: str) -> Iterator[Session]:
+    """
+    Open a session on a database file, holding the file's lock until it closes.
+    
+    Saves may run on a background thread, and every engine shares a single
+    connection, so sessions on the same file must not overlap.
+    """
+    database = _open_database(db_path)
+    with database.lock:
+        session = database.session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+
+def _dispose_engine(db_path: str) -> None:
+    """Close the pooled connections to a database file before it is removed."""
+    with _databases_lock:
+        database = _databases.pop(db_path, None)
+    if database is not None:
+        _close_database(database)
+    _initialized.discard(db_path)
+
+
+def _backup(source_path: str, target_path: str) -> None:
+    """
+    Copy a database with SQLite's online backup API.
+    
+    The copy is made page by page through the open connections, so it
+    includes changes still in the source's write-ahead log and the target's
+    connection sees the new contents.
+    """
+    source_database = _open_database(source_path)
+    target_database = _open_database(target_path)
+    with source_database.lock, target_database.lock:
+        source = source_database.engine.raw_connection()
+        target = target_database.engine.raw_connection()
+        try:
+            source.driver_connection.backup(target.driver_connection)
+        finally:
+            target.close()
+            source.close()
+
+
+def _fingerprint(snapshot: Dict[str, Any]) -> Tuple:
+    """Identify the saved state of a notebook snapshot by its timestamps."""
+    return (
+        snapshot["name"],
+        snapshot["updated_at"],
+        tuple((page[0], page[4]) for page in snapshot["pages"])
+    )
+
+
+def _read_page_content(db_path: str, page_id: int) -> str:
+    """
+    Read the content of one page, for pages loaded with deferred content.
+    
+    Raises:
+        LookupError: If the database no longer holds the page
+    """
+    with _locked_session(db_path) as session:
+        content = session.execute(
+            select(PageRecord.content)
+            .where(PageRecord.notebook_id == 1)
+            .where(PageRecord.page_id == page_id)
+        ).scalar()
+    if content is None:
+        raise LookupError(f"Page {page_id} is missing from {db_path}")
+    return content
+
+
+def _checkpoint(db_path: str) -> None:
+    """Move committed changes from the write-ahead log into the database file."""
+    if os.path.exists(db_path + "-wal"):
+        database = _open_database(db_path)
+        with database.lock, database.engine.connect() as connection:
+            connection.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+
 
 class NotebookRecord(Base):
     """SQLAlchemy model for notebook metadata."""
@@ -25,7 +313,7 @@ class NotebookRecord(Base):
     name = Column(String, nullable=False)
     created_at = Column(DateTime, nullable=False)
     updated_at = Column(DateTime, nullable=False)
-    notebook_metadata = Column(Text, nullable=False)  # JSON serialized
+    notebook_metadata = Column(CompressedText, nullable=False)  # JSON serialized
 
 
 class PageRecord(Base):
@@ -36,10 +324,15 @@ class PageRecord(Base):
     notebook_id = Column(Integer, nullable=False)
     page_id = Column(Integer, nullable=False)
     name = Column(String, nullable=False)
-    content = Column(Text, nullable=False)
+    content = Column(CompressedText, nullable=False)
     created_at = Column(DateTime, nullable=False)
     updated_at = Column(DateTime, nullable=False)
-    page_metadata = Column(Text, nullable=False)  # JSON serialized
+    page_metadata = Column(CompressedText, nullable=False)  # JSON serialized
+    
+    # Every query selects pages by notebook, and saves by page ID within it
+    __table_args__ = (
+        Index("ix_pages_nb_pid", "notebook_id", "page_id"),
+    )
 
 
 class NotebookStorage:
@@ -63,7 +356,14 @@ class NotebookStorage:
             self.storage_dir = storage_dir
             
         # Ensure the storage directory exists
-        os.makedirs(self.storage_dir, exist_ok=True)
+        _ensure_dir(self.storage_dir)
+        
+        # Single worker for background saves, so saves run in submission order
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nb-save")
+        self._pending_saves: Dict[str, Future] = {}
+        
+        # Fingerprints of the notebook states last written to each database
+        self._saved_fingerprints: Dict[str, Tuple] = {}
     
     def set_storage_directory(self, directory: str) -> None:
         """
@@ -72,8 +372,7 @@ class NotebookStorage:
         Args:
             directory: Directory to use for storage
         """
-        if not os.path.exists(directory):
-            os.makedirs(directory, exist_ok=True)
+        _ensure_dir(directory)
         self.storage_dir = directory
     
     def get_storage_directory(self) -> str:
@@ -87,14 +386,31 @@ class NotebookStorage:
     
     def _get_db_path(self, notebook_name: str) -> str:
         """Get the database file path for a notebook."""
-        # Sanitize the notebook name for use in a filename
-        safe_name = "".join(c if c.isalnum() or c in " _-" else "_" for c in notebook_name)
-        return os.path.join(self.storage_dir, f"{safe_name}.db")
+        return _compute_db_path(self.storage_dir, notebook_name)
+    
+    def get_index_path(self, db_path: str) -> str:
+        """
+        Get the path of the search index file kept next to a notebook database.
+        
+        Args:
+            db_path: Path to the notebook database file
+            
+        Returns:
+            Path for the notebook's saved search index
+        """
+        return os.path.splitext(db_path)[0] + ".idx"
     
     def _initialize_db(self, db_path: str) -> None:
-        """Initialize the database schema."""
-        engine = create_engine(f"sqlite:///{db_path}")
-        Base.metadata.create_all(engine)
+        """Initialize the database schema, once per database file."""
+        if db_path not in _initialized:
+            engine = _get_engine(db_path)
+            Base.metadata.create_all(engine)
+            
+            # create_all skips existing tables along with their indexes, so
+            # add indexes missing from databases created by older versions
+            for index in PageRecord.__table__.indexes:
+                index.create(engine, checkfirst=True)
+            _initialized.add(db_path)
     
     def save_notebook(self, notebook: Notebook) -> None:
         """
@@ -104,48 +420,206 @@ class NotebookStorage:
             notebook: The notebook to save
         """
         db_path = self._get_db_path(notebook.name)
-        self._initialize_db(db_path)
+        self._store_snapshot(db_path, self._snapshot(notebook))
+    
+    def is_saved(self, notebook: Notebook, db_path: str) -> bool:
+        """
+        Check whether a database file holds a notebook as it is now.
         
-        engine = create_engine(f"sqlite:///{db_path}")
-        Session = sessionmaker(bind=engine)
-        session = Session()
+        Only saves and loads made through this storage manager are known,
+        so a file it has not written or read is never reported as holding
+        the notebook.
         
-        try:
-            # Save notebook metadata
-            notebook_record = session.query(NotebookRecord).filter_by(id=1).first()
-            if notebook_record is None:
-                notebook_record = NotebookRecord(id=1)
-                
-            notebook_record.name = notebook.name
-            notebook_record.created_at = notebook.created_at
-            notebook_record.updated_at = notebook.updated_at
-            notebook_record.notebook_metadata = json.dumps(notebook.notebook_metadata)
+        Args:
+            notebook: The notebook to check
+            db_path: Path to the database file
             
-            # Add or update the notebook record
-            session.add(notebook_record)
+        Returns:
+            True if the notebook has not changed since it was last saved to
+            or loaded from the file
+        """
+        return (self._saved_fingerprints.get(db_path) == _fingerprint(self._snapshot(notebook))
+                and os.path.exists(db_path))
+    
+    def save_notebook_async(self, notebook: Notebook, directory: Optional[str] = None) -> Future:
+        """
+        Save a notebook to storage on a background thread.
+        
+        The notebook is copied before returning, so it can be edited while the
+        save runs. A save of the same notebook that has not started yet is
+        cancelled in favour of this newer one.
+        
+        Args:
+            notebook: The notebook to save
+            directory: Optional directory to save to instead of the storage directory
             
-            # Delete existing pages (simple approach - could be optimized)
-            session.query(PageRecord).filter_by(notebook_id=1).delete()
+        Returns:
+            Future that completes when the notebook is saved, raising any
+            error the save raised
+        """
+        if directory is None:
+            db_path = self._get_db_path(notebook.name)
+        else:
+            _ensure_dir(directory)
+            db_path = _compute_db_path(directory, notebook.name)
+        return self._submit_save(db_path, self._snapshot(notebook))
+    
+    def _submit_save(self, db_path: str, snapshot: Dict[str, Any], source_path: Optional[str] = None) -> Future:
+        """
+        Queue a snapshot to be stored by the save worker, replacing a queued save of the same file.
+        
+        Args:
+            db_path: Path to the database file
+            snapshot: The notebook state to write
+            source_path: Optional database the snapshot may be copied from
             
-            # Save all pages
-            for page_id, page in notebook.pages.items():
-                page_record = PageRecord(
-                    notebook_id=1,
-                    page_id=page_id,
-                    name=page.name,
-                    content=page.content,
-                    created_at=page.created_at,
-                    updated_at=page.updated_at,
-                    page_metadata=json.dumps(page.page_metadata)
-                )
-                session.add(page_record)
+        Returns:
+            Future that completes with the database path once it is saved
+        """
+        pending = self._pending_saves.get(db_path)
+        if pending is not None:
+            pending.cancel()
+        future = self._save_executor.submit(self._store_snapshot, db_path, snapshot, source_path)
+        self._pending_saves[db_path] = future
+        return future
+    
+    def _snapshot(self, notebook: Notebook) -> Dict[str, Any]:
+        """
+        Copy the state of a notebook that is written to storage.
+        
+        Args:
+            notebook: The notebook to copy
+            
+        Returns:
+            Dictionary with the notebook fields and a "pages" list of
+            (page_id, name, content, created_at, updated_at, metadata) tuples,
+            where content is the page's content loader if it was never read
+        """
+        return {
+            "name": notebook.name,
+            "created_at": notebook.created_at,
+            "updated_at": notebook.updated_at,
+            "metadata": dict(notebook.notebook_metadata),
+            "pages": [
+                (page_id, page.name, page.content_loader or page.content, page.created_at, page.updated_at,
+                 dict(page.page_metadata))
+                for page_id, page in notebook.pages.items()
+            ],
+        }
+    
+    def _store_snapshot(self, db_path: str, snapshot: Dict[str, Any], source_path: Optional[str] = None) -> str:
+        """
+        Store a notebook snapshot, unless the database already holds it.
+        
+        Snapshots are compared by their fingerprint, so saving a notebook
+        that has not changed since it was saved or loaded writes nothing,
+        once the database schema has been brought up to date.
+        
+        Args:
+            db_path: Path to the database file
+            snapshot: The notebook state to write
+            source_path: Optional database the snapshot may be copied from
             
-            session.commit()
+        Returns:
+            The path to the saved database file
+        """
+        # Skip databases already holding the snapshot, once their schema is
+        # known to be current
+        fingerprint = _fingerprint(snapshot)
+        if (db_path in _initialized and self._saved_fingerprints.get(db_path) == fingerprint
+                and os.path.exists(db_path)):
+            return db_path
+        
+        # If the notebook is unchanged since it was saved to the source, copy
+        # that database with the backup API instead of writing every page
+        if (source_path is not None and db_path != source_path
+                and self._saved_fingerprints.get(source_path) == fingerprint
+                and os.path.exists(source_path)):
+            _backup(source_path, db_path)
+            self._saved_fingerprints[db_path] = fingerprint
+        else:
+            self._write_snapshot(db_path, snapshot)
+        return db_path
+    
+    def _write_snapshot(self, db_path: str, snapshot: Dict[str, Any]) -> None:
+        """
+        Write a notebook snapshot from _snapshot to a database file.
+        
+        Args:
+            db_path: Path to the database file
+            snapshot: The notebook state to write
+        """
+        try:
+            with _locked_session(db_path) as session:
+                self._initialize_db(db_path)
+                
+                # Compare against the stored pages: every change to a page
+                # goes through a Page method that advances updated_at, so
+                # pages with an unchanged timestamp need no writes
+                with session.begin():
+                    stored = dict(session.execute(
+                        select(PageRecord.page_id, PageRecord.updated_at).where(PageRecord.notebook_id == 1)
+                    ).all())
+                changed_pages = [page for page in snapshot["pages"] if stored.get(page[0]) != page[4]]
+                removed_ids = stored.keys() - {page[0] for page in snapshot["pages"]}
+                
+                # Read the content of changed pages that was never loaded
+                # before the write starts: a loader may read this database,
+                # through the connection the write transaction uses
+                changed_pages = [
+                    page if isinstance(page[2], str) else page[:2] + (page[2](),) + page[3:]
+                    for page in changed_pages
+                ]
+                
+                # Write everything in one transaction, committed when the block
+                # ends and rolled back if anything in it fails
+                with session.begin():
+                    # Save notebook metadata
+                    notebook_record = session.query(NotebookRecord).filter_by(id=1).first()
+                    if notebook_record is None:
+                        notebook_record = NotebookRecord(id=1)
+                        
+                    notebook_record.name = snapshot["name"]
+                    notebook_record.created_at = snapshot["created_at"]
+                    notebook_record.updated_at = snapshot["updated_at"]
+                    notebook_record.notebook_metadata = _dumps(snapshot["metadata"])
+                    
+                    # Add or update the notebook record
+                    session.add(notebook_record)
+                    
+                    # Delete removed pages and the old rows of changed pages
+                    stale_ids = [page[0] for page in changed_pages if page[0] in stored]
+                    stale_ids.extend(removed_ids)
+                    for start in range(0, len(stale_ids), _ID_CHUNK_SIZE):
+                        session.execute(
+                            delete(PageRecord)
+                            .where(PageRecord.notebook_id == 1)
+                            .where(PageRecord.page_id.in_(stale_ids[start:start + _ID_CHUNK_SIZE]))
+                        )
+                    
+                    # Save new and changed pages with one Core executemany,
+                    # bypassing the ORM for the page rows entirely
+                    page_rows = [
+                        {
+                            "notebook_id": 1,
+                            "page_id": page_id,
+                            "name": name,
+                            "content": content,
+                            "created_at": created_at,
+                            "updated_at": updated_at,
+                            "page_metadata": _dumps(page_metadata)
+                        }
+                        for page_id, name, content, created_at, updated_at, page_metadata in changed_pages
+                    ]
+                    if page_rows:
+                        session.execute(
+                            PageRecord.__table__.insert().execution_options(insertmanyvalues_page_size=500),
+                            page_rows
+                        )
         except Exception as e:
-            session.rollback()
             raise Exception(f"Failed to save notebook: {str(e)}")
-        finally:
-            session.close()
+        
+        self._saved_fingerprints[db_path] = _fingerprint(snapshot)
     
     def save_notebook_as(self, notebook: Notebook, directory: str, new_name: Optional[str] = None) -> str:
         """
@@ -162,33 +636,34 @@ class NotebookStorage:
         Raises:
             ValueError: If the directory is invalid
         """
-        # Remember the original storage directory
-        original_dir = self.storage_dir
+        return self.save_notebook_as_async(notebook, directory, new_name).result()
+    
+    def save_notebook_as_async(self, notebook: Notebook, directory: str, new_name: Optional[str] = None) -> Future:
+        """
+        Save a notebook to a specific directory on a background thread, optionally with a new name.
         
-        try:
-            # Set the new storage directory
-            self.set_storage_directory(directory)
-            
-            # If a new name is provided, temporarily rename the notebook
-            original_name = None
-            if new_name:
-                original_name = notebook.name
-                notebook.name = new_name
-            
-            # Save the notebook
-            self.save_notebook(notebook)
+        The notebook is copied before returning, as in save_notebook_async,
+        and keeps its own name; only the saved copy is renamed.
+        
+        Args:
+            notebook: The notebook to save
+            directory: Directory where the notebook should be saved
+            new_name: Optional new name for the notebook
             
-            # Get the path to the saved file
-            db_path = self._get_db_path(notebook.name)
+        Returns:
+            Future that completes with the path to the saved notebook file,
+            raising any error the save raised
             
-            # Restore the original name if it was changed
-            if original_name:
-                notebook.name = original_name
-                
-            return db_path
-        finally:
-            # Restore the original storage directory
-            self.storage_dir = original_dir
+        Raises:
+            ValueError: If the directory is invalid
+        """
+        _ensure_dir(directory)
+        snapshot = self._snapshot(notebook)
+        if new_name:
+            snapshot["name"] = new_name
+        
+        db_path = _compute_db_path(directory, snapshot["name"])
+        return self._submit_save(db_path, snapshot, self._get_db_path(notebook.name))
     
     def load_notebook(self, notebook_name: str) -> Optional[Notebook]:
         """
@@ -204,44 +679,11 @@ class NotebookStorage:
         if not os.path.exists(db_path):
             return None
         
-        engine = create_engine(f"sqlite:///{db_path}")
-        Session = sessionmaker(bind=engine)
-        session = Session()
-        
         try:
-            # Load notebook metadata
-            notebook_record = session.query(NotebookRecord).filter_by(id=1).first()
-            if notebook_record is None:
-                return None
-            
-            # Create notebook object
-            notebook = Notebook(name=notebook_record.name)
-            notebook.created_at = notebook_record.created_at
-            notebook.updated_at = notebook_record.updated_at
-            notebook.notebook_metadata = json.loads(notebook_record.notebook_metadata)
-            
-            # Load all pages
-            page_records = session.query(PageRecord).filter_by(notebook_id=1).all()
-            for page_record in page_records:
-                from src.core.page import Page
-                
-                page = Page(
-                    page_id=page_record.page_id,
-                    name=page_record.name,
-                    content=page_record.content
-                )
-                page.created_at = page_record.created_at
-                page.updated_at = page_record.updated_at
-                page.page_metadata = json.loads(page_record.page_metadata)
-                
-                notebook.pages[page.page_id] = page
-            
-            return notebook
-        except Exception as e:
-            print(f"Error loading notebook: {str(e)}")
+            return self._read_notebook(db_path)
+        except _LOAD_ERRORS as e:
+            logger.debug("Error loading notebook: %s", e)
             return None
-        finally:
-            session.close()
     
     def load_notebook_from_file(self, db_path: str) -> Optional[Notebook]:
         """
@@ -256,11 +698,23 @@ class NotebookStorage:
         if not os.path.exists(db_path):
             return None
         
-        engine = create_engine(f"sqlite:///{db_path}")
-        Session = sessionmaker(bind=engine)
-        session = Session()
-        
         try:
+            return self._read_notebook(db_path)
+        except _LOAD_ERRORS as e:
+            logger.debug("Error loading notebook from file: %s", e)
+            return None
+    
+    def _read_notebook(self, db_path: str) -> Optional[Notebook]:
+        """
+        Read a notebook from an existing database file.
+        
+        Args:
+            db_path: Path to the database file
+            
+        Returns:
+            The loaded Notebook object, or None if the file holds no notebook
+        """
+        with _locked_session(db_path) as session:
             # Load notebook metadata
             notebook_record = session.query(NotebookRecord).filter_by(id=1).first()
             if notebook_record is None:
@@ -270,30 +724,35 @@ class NotebookStorage:
             notebook = Notebook(name=notebook_record.name)
             notebook.created_at = notebook_record.created_at
             notebook.updated_at = notebook_record.updated_at
-            notebook.notebook_metadata = json.loads(notebook_record.notebook_metadata)
+            notebook.notebook_metadata = _loads(notebook_record.notebook_metadata)
             
-            # Load all pages
-            page_records = session.query(PageRecord).filter_by(notebook_id=1).all()
-            for page_record in page_records:
-                from src.core.page import Page
-                
-                page = Page(
-                    page_id=page_record.page_id,
-                    name=page_record.name,
-                    content=page_record.content
+            # Load all pages, streaming plain row tuples rather than
+            # building an ORM object per page; page contents are only
+            # read from the database when first used
+            page_rows = session.execute(
+                select(
+                    PageRecord.page_id,
+                    PageRecord.name,
+                    PageRecord.created_at,
+                    PageRecord.updated_at,
+                    PageRecord.page_metadata
                 )
-                page.created_at = page_record.created_at
-                page.updated_at = page_record.updated_at
-                page.page_metadata = json.loads(page_record.page_metadata)
+                .where(PageRecord.notebook_id == 1)
+                .order_by(PageRecord.page_id)
+                .execution_options(yield_per=256)
+            )
+            for page_id, name, created_at, updated_at, page_metadata in page_rows:
+                page = Page(page_id=page_id, name=name)
+                page.defer_content(partial(_read_page_content, db_path, page_id))
+                page.created_at = created_at
+                page.updated_at = updated_at
+                page.page_metadata = _loads(page_metadata)
                 
                 notebook.pages[page.page_id] = page
-            
-            return notebook
-        except Exception as e:
-            print(f"Error loading notebook from file: {str(e)}")
-            return None
-        finally:
-            session.close()
+        
+        # The file holds the notebook as loaded, so saving it unchanged is a no-op
+        self._saved_fingerprints[db_path] = _fingerprint(self._snapshot(notebook))
+        return notebook
     
     def list_notebooks(self) -> Dict[str, str]:
         """
@@ -302,13 +761,13 @@ class NotebookStorage:
         Returns:
             Dictionary of notebook names and their file paths
         """
-        notebooks = {}
-        for filename in os.listdir(self.storage_dir):
-            if filename.endswith(".db"):
-                notebook_name = os.path.splitext(filename)[0]
-                notebooks[notebook_name] = os.path.join(self.storage_dir, filename)
-        
-        return notebooks
+        # A single directory scan yields each entry's name, path and type
+        with os.scandir(self.storage_dir) as entries:
+            return {
+                entry.name[:-3]: entry.path
+                for entry in entries
+                if entry.name.endswith(".db") and entry.is_file()
+            }
     
     def delete_notebook(self, notebook_name: str) -> bool:
         """
@@ -321,11 +780,21 @@ class NotebookStorage:
             True if the notebook was deleted, False otherwise
         """
         db_path = self._get_db_path(notebook_name)
-        if os.path.exists(db_path):
+        _dispose_engine(db_path)
+        self._saved_fingerprints.pop(db_path, None)
+        try:
             os.remove(db_path)
-            return True
+        except FileNotFoundError:
+            return False
         
-        return False
+        # Remove the log files left by connections outside this process, and
+        # the saved search index
+        for path in [db_path + suffix for suffix in _WAL_SUFFIXES] + [self.get_index_path(db_path)]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        return True
     
     def transfer_notebooks(self, source_dir: str, target_dir: str) -> Dict[str, str]:
         """
@@ -344,8 +813,7 @@ class NotebookStorage:
         if not os.path.exists(source_dir):
             raise ValueError(f"Source directory does not exist: {source_dir}")
         
-        if not os.path.exists(target_dir):
-            os.makedirs(target_dir, exist_ok=True)
+        _ensure_dir(target_dir)
         
         # Dictionary to store transferred notebook info
         transferred_notebooks = {}
@@ -361,9 +829,17 @@ class NotebookStorage:
                     continue
                 
                 try:
-                    # Copy the file from source to target
-                    import shutil
-                    shutil.copy2(source_path, target_path)
+                    if source_path in _databases:
+                        # The database may be open, with changes in its
+                        # write-ahead log, so copy it through its connection
+                        _backup(source_path, target_path)
+                    else:
+                        # Make sure the database file holds every committed change
+                        _checkpoint(source_path)
+                        
+                        # Copy the file and its timestamps from source to target
+                        _fast_copy(source_path, target_path)
+                        shutil.copystat(source_path, target_path)
                     
                     # Store the notebook name and its new path
                     notebook_name = os.path.splitext(filename)[0]
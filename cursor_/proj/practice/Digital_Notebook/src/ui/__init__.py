@@ -6,5 +6,7 @@ This package contains the UI classes for the application.
 
 from src.ui.notebook_ui import NotebookUI
 from src.ui.page_view import PageView
+from src.ui.pages_model import PagesModel
+from src.ui.search_results_model import SearchResultsModel
 
-__all__ = ["NotebookUI", "PageView"]
+__all__ = ["NotebookUI", "PageView", "PagesModel", "SearchResultsModel"]
@@ -5,24 +5,160 @@ This module provides the main user interface for the Digital Notebook applicatio
 """
 import sys
 import os
-from typing import Optional, Dict, List, Any
+from concurrent.futures import Future, wait
+from typing import Optional, Dict, List, Any, Tuple, Callable
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QLabel, QLineEdit, QPushButton, QTextEdit,
-    QSplitter, QListWidget, QListWidgetItem, QMenu, QMessageBox,
+    QSplitter, QListView, QListWidget, QMenu, QMessageBox,
     QDialog, QDialogButtonBox, QFormLayout, QStatusBar,
     QFileDialog
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QAction, QIcon, QTextCursor
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer, QObject, QRunnable, QThreadPool, QStringListModel
+from PyQt6.QtGui import QAction, QIcon, QKeySequence, QShortcut, QTextCursor
 
 from src.core.notebook import Notebook
 from src.core.page import Page
+from src.analysis.word_counter import WordCounter
 from src.data.storage import NotebookStorage
 from src.utils.search import SearchEngine, SearchResult
 from src.utils.config import Config
 from .page_view import PageView
+from .pages_model import PagesModel
+from .search_results_model import SearchResultsModel
+
+
+def _configure_list_view(view: QListView) -> None:
+    """
+    Set up a list view for long lists of single-line rows.
+    
+    Every row gets the size of the first, and rows are laid out in batches
+    so the view stays responsive while a long list is first shown.
+    """
+    view.setUniformItemSizes(True)
+    view.setLayoutMode(QListView.LayoutMode.Batched)
+    view.setBatchSize(100)
+    view.setResizeMode(QListView.ResizeMode.Adjust)
+
+
+class _SearchSignals(QObject):
+    """Signals reporting the results of a background search."""
+    
+    # Emitted with the search's sequence number and its results
+    finished = pyqtSignal(int, list)
+
+
+class _SearchTask(QRunnable):
+    """Runs a notebook search on a thread pool thread."""
+    
+    def __init__(self, search_engine: SearchEngine, query: str, seq: int):
+        """
+        Initialize the search task.
+        
+        Args:
+            search_engine: Search engine to run the query with
+            query: Text to search for
+            seq: Sequence number identifying this search
+        """
+        super().__init__()
+        self.search_engine = search_engine
+        self.query = query
+        self.seq = seq
+        self.signals = _SearchSignals()
+    
+    def run(self):
+        """Run the search and report its results."""
+        try:
+            results = self.search_engine.advanced_search(self.query)
+        except Exception:
+            results = []
+        self.signals.finished.emit(self.seq, results)
+
+
+class _WordCountSignals(QObject):
+    """Signals reporting the results of a background word count."""
+    
+    # Emitted with the total and a list of (page name, word count) pairs
+    finished = pyqtSignal(int, list)
+
+
+class _WordCountTask(QRunnable):
+    """Counts the words on every page of a notebook on a thread pool thread."""
+    
+    def __init__(self, word_counter: WordCounter, pages: List[Page]):
+        """
+        Initialize the word count task.
+        
+        Args:
+            word_counter: Word counter caching the count on each page
+            pages: Pages to count
+        """
+        super().__init__()
+        self.word_counter = word_counter
+        self.pages = pages
+        self.signals = _WordCountSignals()
+    
+    def run(self):
+        """Count the words and report the counts."""
+        counts = [(page.name, self.word_counter.count_words_cached(page)) for page in self.pages]
+        self.signals.finished.emit(sum(count for _, count in counts), counts)
+
+
+class _IndexSignals(QObject):
+    """Signals reporting the end of a background index build."""
+    
+    # Emitted with the build's sequence number
+    finished = pyqtSignal(int)
+
+
+class _IndexTask(QRunnable):
+    """Builds a search engine's inverted index on a thread pool thread."""
+    
+    def __init__(self, search_engine: SearchEngine, seq: int, index_path: Optional[str] = None):
+        """
+        Initialize the indexing task.
+        
+        Args:
+            search_engine: Search engine whose index to build
+            seq: Sequence number identifying this build
+            index_path: Optional saved index to reuse for unchanged pages
+        """
+        super().__init__()
+        self.search_engine = search_engine
+        self.seq = seq
+        self.index_path = index_path
+        self.signals = _IndexSignals()
+    
+    def run(self):
+        """Build the index and report that it is done."""
+        try:
+            self.search_engine.build_index(self.index_path)
+        finally:
+            self.signals.finished.emit(self.seq)
+
+
+class _SaveIndexTask(QRunnable):
+    """Saves a search engine's inverted index on a thread pool thread."""
+    
+    def __init__(self, search_engine: SearchEngine, index_path: str):
+        """
+        Initialize the index saving task.
+        
+        Args:
+            search_engine: Search engine whose index to save
+            index_path: Path of the file to write
+        """
+        super().__init__()
+        self.search_engine = search_engine
+        self.index_path = index_path
+    
+    def run(self):
+        """Save the index, leaving it to be rebuilt next time if that fails."""
+        try:
+            self.search_engine.save_index(self.index_path)
+        except OSError:
+            pass
 
 
 class NotebookUI(QMainWindow):
@@ -32,6 +168,11 @@ class NotebookUI(QMainWindow):
     This class provides the user interface for interacting with the notebook.
     """
     
+    # Emitted from the storage worker when a background save ends, with the
+    # function to call with the saved path on success, that path, and the
+    # error message for a failed save
+    _save_finished = pyqtSignal(object, str, str)
+    
     def __init__(self):
         """Initialize the notebook UI."""
         super().__init__()
@@ -45,14 +186,58 @@ class NotebookUI(QMainWindow):
         self.notebook: Optional[Notebook] = None
         self.search_engine = SearchEngine()
         
+        # Word counter for the analysis dialog; it keeps each page's count
+        # on the page until the page's content changes
+        self._word_counter = WordCounter()
+        
         # Track the current page
         self.current_page: Optional[Page] = None
         
         # Track the current notebook file path
         self.current_notebook_path: Optional[str] = None
         
+        # Editor changes waiting to be applied to the current page, as
+        # (position, removed, inserted) deltas; a burst of edits is applied
+        # once, when typing pauses
+        self._pending_deltas: List[Tuple[int, int, str]] = []
+        self._content_debounce = QTimer(self)
+        self._content_debounce.setSingleShot(True)
+        self._content_debounce.setInterval(250)
+        self._content_debounce.timeout.connect(self._flush_content)
+        
+        # Shows the selected page in the editor on the next event loop pass,
+        # so the list paints its new selection before the page is laid out
+        self._show_page_timer = QTimer(self)
+        self._show_page_timer.setSingleShot(True)
+        self._show_page_timer.setInterval(0)
+        self._show_page_timer.timeout.connect(self._show_current_page)
+        
+        # Sequence number of the latest search; results of older searches are dropped
+        self._search_seq = 0
+        
+        # Sequence number of the latest index build; only it re-enables search
+        self._index_seq = 0
+        
+        # Background save still running, if any
+        self._pending_save: Optional[Future] = None
+        self._save_finished.connect(self._on_save_finished)
+        
+        # Dialogs built on first use and reused afterwards
+        self._search_dialog: Optional[QDialog] = None
+        self._prompt_dialog: Optional[QDialog] = None
+        
+        # Page waiting for the user to confirm its deletion
+        self._pending_delete_id: Optional[int] = None
+        
         # Set up the UI
         self.init_ui()
+        
+        # Delete confirmation, reused and shown without a nested event loop
+        self._confirm_box = QMessageBox(self)
+        self._confirm_box.setWindowTitle("Confirm Delete")
+        self._confirm_box.setIcon(QMessageBox.Icon.Question)
+        self._confirm_box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        self._confirm_box.buttonClicked.connect(self._on_confirm_delete)
     
     def init_ui(self):
         """Set up the user interface."""
@@ -71,6 +256,9 @@ class NotebookUI(QMainWindow):
         # Create the toolbar
         self.create_toolbar()
         
+        # Bind keyboard shortcuts for frequent operations
+        self.create_shortcuts()
+        
         # Create the main splitter
         self.main_splitter = QSplitter(Qt.Orientation.Horizontal)
         self.main_layout.addWidget(self.main_splitter)
@@ -84,87 +272,71 @@ class NotebookUI(QMainWindow):
         # Set up the status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
-        self.status_bar.showMessage(f"Storage directory: {self.storage.get_storage_directory()}")
+        self._set_status(f"Storage directory: {self.storage.get_storage_directory()}")
         
         # Set the initial size ratio between sidebar and content
         self.main_splitter.setSizes([300, 900])
     
+    def _set_status(self, message: str):
+        """Show a status bar message, unless it is the one already shown."""
+        if message != self.status_bar.currentMessage():
+            self.status_bar.showMessage(message)
+    
     def create_menu_bar(self):
         """Create the application menu bar."""
         menu_bar = self.menuBar()
         
-        # File menu
-        file_menu = menu_bar.addMenu("&File")
-        
-        new_notebook_action = QAction("&New Notebook", self)
-        new_notebook_action.triggered.connect(self.create_new_notebook)
-        file_menu.addAction(new_notebook_action)
-        
-        open_notebook_action = QAction("&Open Notebook", self)
-        open_notebook_action.triggered.connect(self.open_notebook)
-        file_menu.addAction(open_notebook_action)
-        
-        open_notebook_from_file_action = QAction("Open Notebook from &File...", self)
-        open_notebook_from_file_action.triggered.connect(self.open_notebook_from_file)
-        file_menu.addAction(open_notebook_from_file_action)
-        
-        file_menu.addSeparator()
-        
-        save_notebook_action = QAction("&Save Notebook", self)
-        save_notebook_action.triggered.connect(self.save_notebook)
-        file_menu.addAction(save_notebook_action)
-        
-        save_notebook_as_action = QAction("Save Notebook &As...", self)
-        save_notebook_as_action.triggered.connect(self.save_notebook_as)
-        file_menu.addAction(save_notebook_as_action)
-        
-        file_menu.addSeparator()
-        
-        set_storage_dir_action = QAction("Set Default Storage &Directory...", self)
-        set_storage_dir_action.triggered.connect(self.set_default_storage_directory)
-        file_menu.addAction(set_storage_dir_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction("E&xit", self)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Edit menu
-        edit_menu = menu_bar.addMenu("&Edit")
-        
-        new_page_action = QAction("New &Page", self)
-        new_page_action.triggered.connect(self.create_new_page)
-        edit_menu.addAction(new_page_action)
-        
-        rename_page_action = QAction("&Rename Page", self)
-        rename_page_action.triggered.connect(self.rename_current_page)
-        edit_menu.addAction(rename_page_action)
-        
-        delete_page_action = QAction("&Delete Page", self)
-        delete_page_action.triggered.connect(self.delete_current_page)
-        edit_menu.addAction(delete_page_action)
-        
-        # View menu
-        view_menu = menu_bar.addMenu("&View")
-        
-        toggle_sidebar_action = QAction("Toggle &Sidebar", self)
-        toggle_sidebar_action.triggered.connect(self.toggle_sidebar)
-        view_menu.addAction(toggle_sidebar_action)
-        
-        # Search menu
-        search_menu = menu_bar.addMenu("&Search")
-        
-        search_action = QAction("&Search Notebook", self)
-        search_action.triggered.connect(self.show_search)
-        search_menu.addAction(search_action)
-        
-        # Analysis menu
-        analysis_menu = menu_bar.addMenu("&Analysis")
-        
-        word_count_action = QAction("&Word Count Analysis", self)
-        word_count_action.triggered.connect(self.show_word_count_analysis)
-        analysis_menu.addAction(word_count_action)
+        # Menus and their actions as (text, handler), with None for separators
+        menu_defs = [
+            ("&File", [
+                ("&New Notebook", self.create_new_notebook),
+                ("&Open Notebook", self.open_notebook),
+                ("Open Notebook from &File...", self.open_notebook_from_file),
+                None,
+                ("&Save Notebook", self.save_notebook),
+                ("Save Notebook &As...", self.save_notebook_as),
+                None,
+                ("Set Default Storage &Directory...", self.set_default_storage_directory),
+                None,
+                ("E&xit", self.close),
+            ]),
+            ("&Edit", [
+                ("New &Page", self.create_new_page),
+                ("&Rename Page", self.rename_current_page),
+                ("&Delete Page", self.delete_current_page),
+            ]),
+            ("&View", [
+                ("Toggle &Sidebar", self.toggle_sidebar),
+            ]),
+            ("&Search", [
+                ("&Search Notebook", self.show_search),
+            ]),
+            ("&Analysis", [
+                ("&Word Count Analysis", self.show_word_count_analysis),
+            ]),
+        ]
+        
+        # Create each menu's actions and add them in one call
+        actions_by_text: Dict[str, QAction] = {}
+        for menu_name, entries in menu_defs:
+            menu = menu_bar.addMenu(menu_name)
+            actions = []
+            for entry in entries:
+                action = QAction(self)
+                if entry is None:
+                    action.setSeparator(True)
+                else:
+                    text, handler = entry
+                    action.setText(text)
+                    action.triggered.connect(handler)
+                    actions_by_text[text] = action
+                actions.append(action)
+            menu.addActions(actions)
+        
+        # Keep the actions that are disabled while they cannot run
+        self.save_notebook_action = actions_by_text["&Save Notebook"]
+        self.save_notebook_as_action = actions_by_text["Save Notebook &As..."]
+        self.search_notebook_action = actions_by_text["&Search Notebook"]
     
     def create_toolbar(self):
         """Create the application toolbar."""
@@ -176,13 +348,24 @@ class NotebookUI(QMainWindow):
         new_page_action.triggered.connect(self.create_new_page)
         toolbar.addAction(new_page_action)
         
-        save_action = QAction("Save", self)
-        save_action.triggered.connect(self.save_notebook)
-        toolbar.addAction(save_action)
+        self.toolbar_save_action = QAction("Save", self)
+        self.toolbar_save_action.triggered.connect(self.save_notebook)
+        toolbar.addAction(self.toolbar_save_action)
         
-        search_action = QAction("Search", self)
-        search_action.triggered.connect(self.show_search)
-        toolbar.addAction(search_action)
+        self.toolbar_search_action = QAction("Search", self)
+        self.toolbar_search_action.triggered.connect(self.show_search)
+        toolbar.addAction(self.toolbar_search_action)
+    
+    def create_shortcuts(self):
+        """
+        Bind keyboard shortcuts for frequent operations.
+        
+        The shortcuts call their handlers directly rather than through the
+        menu actions, which carry no shortcuts of their own.
+        """
+        QShortcut(QKeySequence("Ctrl+N"), self, activated=self.create_new_page)
+        QShortcut(QKeySequence("Ctrl+S"), self, activated=self.save_notebook)
+        QShortcut(QKeySequence("Ctrl+F"), self, activated=self.show_search)
     
     def create_sidebar(self):
         """Create the sidebar for page navigation."""
@@ -191,8 +374,11 @@ class NotebookUI(QMainWindow):
         
         # Pages list
         sidebar_layout.addWidget(QLabel("Pages:"))
-        self.pages_list = QListWidget()
-        self.pages_list.itemClicked.connect(self.on_page_selected)
+        self.pages_model = PagesModel(self)
+        self.pages_list = QListView()
+        self.pages_list.setModel(self.pages_model)
+        _configure_list_view(self.pages_list)
+        self.pages_list.clicked.connect(self.on_page_selected)
         sidebar_layout.addWidget(self.pages_list)
         
         # New page button
@@ -217,15 +403,12 @@ class NotebookUI(QMainWindow):
         if ok and name:
             # Create the notebook
             self.notebook = Notebook(name=name)
-            self.search_engine.set_notebook(self.notebook)
             
             # Reset the current notebook path since this is a new notebook
             self.current_notebook_path = None
             
             # Update the UI
-            self.update_pages_list()
-            self.status_bar.showMessage(f"Created new notebook: {name}")
-            self.setWindowTitle(f"Digital Notebook - {name}")
+            self._show_notebook(f"Created new notebook: {name}")
     
     def open_notebook(self):
         """Open an existing notebook."""
@@ -248,30 +431,37 @@ class NotebookUI(QMainWindow):
         layout.addWidget(QLabel("Select a notebook to open:"))
         
         notebook_list = QListWidget()
+        _configure_list_view(notebook_list)
+        
+        # Collect the row labels, with the notebook path of each row or None
+        # for category headings, and add every row in one batch
+        labels: List[str] = []
+        paths: List[Optional[str]] = []
         
         # Add notebooks from default directory
         if default_notebooks:
-            default_category = QListWidgetItem("Default Storage:")
-            default_category.setFlags(Qt.ItemFlag.NoItemFlags)
-            default_category.setBackground(Qt.GlobalColor.lightGray)
-            notebook_list.addItem(default_category)
-            
+            labels.append("Default Storage:")
+            paths.append(None)
             for name, path in default_notebooks.items():
-                item = QListWidgetItem(f"  {name}")
-                item.setData(Qt.ItemDataRole.UserRole, path)
-                notebook_list.addItem(item)
+                labels.append(f"  {name}")
+                paths.append(path)
         
         # Add notebooks from custom locations
         if custom_notebooks:
-            custom_category = QListWidgetItem("Custom Locations:")
-            custom_category.setFlags(Qt.ItemFlag.NoItemFlags)
-            custom_category.setBackground(Qt.GlobalColor.lightGray)
-            notebook_list.addItem(custom_category)
-            
+            labels.append("Custom Locations:")
+            paths.append(None)
             for path, name in custom_notebooks.items():
-                item = QListWidgetItem(f"  {name} ({os.path.dirname(path)})")
+                labels.append(f"  {name} ({os.path.dirname(path)})")
+                paths.append(path)
+        
+        notebook_list.addItems(labels)
+        for row, path in enumerate(paths):
+            item = notebook_list.item(row)
+            if path is None:
+                item.setFlags(Qt.ItemFlag.NoItemFlags)
+                item.setBackground(Qt.GlobalColor.lightGray)
+            else:
                 item.setData(Qt.ItemDataRole.UserRole, path)
-                notebook_list.addItem(item)
         
         layout.addWidget(notebook_list)
         
@@ -294,6 +484,9 @@ class NotebookUI(QMainWindow):
             selected = notebook_list.currentItem()
             if selected and selected.data(Qt.ItemDataRole.UserRole):
                 notebook_path = selected.data(Qt.ItemDataRole.UserRole)
+                if self._is_open_and_saved(notebook_path):
+                    self._set_status(f"Notebook already open: {self.notebook.name}")
+                    return
                 try:
                     # Load the notebook from the path
                     self.notebook = self.storage.load_notebook_from_file(notebook_path)
@@ -305,10 +498,7 @@ class NotebookUI(QMainWindow):
                         if notebook_path not in default_notebooks.values():
                             self.config.add_recent_notebook_location(notebook_path, self.notebook.name)
                         
-                        self.search_engine.set_notebook(self.notebook)
-                        self.update_pages_list()
-                        self.status_bar.showMessage(f"Opened notebook: {self.notebook.name}")
-                        self.setWindowTitle(f"Digital Notebook - {self.notebook.name}")
+                        self._show_notebook(f"Opened notebook: {self.notebook.name}", notebook_path)
                     else:
                         QMessageBox.critical(self, "Error", f"Failed to load notebook from: {notebook_path}")
                 except Exception as e:
@@ -326,7 +516,9 @@ class NotebookUI(QMainWindow):
             "Notebook Files (*.db);;All Files (*)"
         )
         
-        if file_path:
+        if file_path and self._is_open_and_saved(file_path):
+            self._set_status(f"Notebook already open: {self.notebook.name}")
+        elif file_path:
             try:
                 # Load the notebook from the selected file
                 self.notebook = self.storage.load_notebook_from_file(file_path)
@@ -341,33 +533,128 @@ class NotebookUI(QMainWindow):
                         self.config.add_recent_notebook_location(file_path, self.notebook.name)
                     
                     # Update the UI
-                    self.search_engine.set_notebook(self.notebook)
-                    self.update_pages_list()
-                    self.status_bar.showMessage(f"Opened notebook from file: {file_path}")
-                    self.setWindowTitle(f"Digital Notebook - {self.notebook.name}")
+                    self._show_notebook(f"Opened notebook from file: {file_path}", file_path)
                 else:
                     QMessageBox.critical(self, "Error", f"Failed to load notebook from file: {file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to load notebook: {str(e)}")
     
+    def _is_open_and_saved(self, file_path: str) -> bool:
+        """
+        Check whether a file holds the open notebook, with no changes since it was saved or opened.
+        
+        Opening such a file again would only reload and reindex the same notebook.
+        
+        Args:
+            file_path: Path of the notebook file about to be opened
+            
+        Returns:
+            True if the file is the current notebook's and holds it as it is now
+        """
+        if not self.notebook or not self.current_notebook_path:
+            return False
+        if os.path.realpath(file_path) != os.path.realpath(self.current_notebook_path):
+            return False
+        
+        self._flush_content()
+        return self.storage.is_saved(self.notebook, self.current_notebook_path)
+    
+    def _show_notebook(self, message: str, notebook_path: Optional[str] = None):
+        """
+        Show the current notebook after it was created or opened.
+        
+        The window is repainted once, after the page list, status bar and
+        title have all changed; the status bar would otherwise repaint
+        its message right away.
+        
+        Args:
+            message: Status bar message to show
+            notebook_path: Path of the database file the notebook was opened from
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            self._set_search_notebook(self.storage.get_index_path(notebook_path) if notebook_path else None)
+            self.update_pages_list()
+            self._set_status(message)
+            self.setWindowTitle(f"Digital Notebook - {self.notebook.name}")
+        finally:
+            self.setUpdatesEnabled(True)
+    
     def save_notebook(self):
         """Save the current notebook."""
         if not self.notebook:
             QMessageBox.warning(self, "No Notebook", "No notebook is currently open.")
             return
         
+        # Wait for the running save, as the disabled save actions do
+        if not self.save_notebook_action.isEnabled():
+            return
+        
+        self._flush_content()
+        
+        # If we have a current notebook path, save to that location instead of default
+        if self.current_notebook_path and os.path.exists(os.path.dirname(self.current_notebook_path)):
+            directory = os.path.dirname(self.current_notebook_path)
+            message = f"Saved notebook to: {self.current_notebook_path}"
+        else:
+            # Otherwise save to the default location
+            directory = None
+            message = f"Saved notebook: {self.notebook.name}"
+        
         try:
-            # If we have a current notebook path, save to that location instead of default
-            if self.current_notebook_path and os.path.exists(os.path.dirname(self.current_notebook_path)):
-                directory = os.path.dirname(self.current_notebook_path)
-                self.storage.save_notebook_as(self.notebook, directory)
-                self.status_bar.showMessage(f"Saved notebook to: {self.current_notebook_path}")
-            else:
-                # Otherwise save to the default location
-                self.storage.save_notebook(self.notebook)
-                self.status_bar.showMessage(f"Saved notebook: {self.notebook.name}")
+            # The notebook is copied here and written on the storage worker
+            future = self.storage.save_notebook_async(self.notebook, directory)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save notebook: {str(e)}")
+            return
+        
+        self._track_save(future, lambda file_path: self._set_status(message))
+    
+    def _track_save(self, future: Future, on_saved: Callable[[str], None]):
+        """
+        Disable saving until a background save ends.
+        
+        Args:
+            future: Future of the save, completing with the saved path
+            on_saved: Function called on the UI thread with the saved path if the save succeeds
+        """
+        notebook = self.notebook
+        
+        def saved(file_path: str):
+            self._save_search_index(notebook, file_path)
+            on_saved(file_path)
+        
+        self._pending_save = future
+        self._set_save_enabled(False)
+        self._set_status(f"Saving notebook: {self.notebook.name}...")
+        future.add_done_callback(lambda f: self._report_save(f, saved))
+    
+    def _report_save(self, future: Future, on_saved: Callable[[str], None]):
+        """Report the end of a background save to the UI thread."""
+        # A save cancelled in favour of a newer one is reported by that one
+        if future.cancelled():
+            return
+        
+        error = future.exception()
+        if error:
+            self._save_finished.emit(on_saved, "", str(error))
+        else:
+            self._save_finished.emit(on_saved, future.result(), "")
+    
+    def _on_save_finished(self, on_saved: Callable[[str], None], file_path: str, error: str):
+        """Show the outcome of a background save."""
+        self._pending_save = None
+        self._set_save_enabled(True)
+        if error:
+            QMessageBox.critical(self, "Error", error)
+        else:
+            on_saved(file_path)
+    
+    def _set_save_enabled(self, enabled: bool):
+        """Enable or disable the save actions."""
+        self.save_notebook_action.setEnabled(enabled)
+        self.save_notebook_as_action.setEnabled(enabled)
+        self.toolbar_save_action.setEnabled(enabled)
     
     def save_notebook_as(self):
         """Save the current notebook to a specific location."""
@@ -375,6 +662,12 @@ class NotebookUI(QMainWindow):
             QMessageBox.warning(self, "No Notebook", "No notebook is currently open.")
             return
         
+        # Wait for the running save, as the disabled save actions do
+        if not self.save_notebook_as_action.isEnabled():
+            return
+        
+        self._flush_content()
+        
         # Show directory selection dialog
         directory = QFileDialog.getExistingDirectory(
             self,
@@ -384,52 +677,69 @@ class NotebookUI(QMainWindow):
         )
         
         if directory:
-            try:
-                # Optionally prompt for a new name
-                new_name = None
-                change_name = QMessageBox.question(
-                    self,
-                    "Change Name",
-                    "Would you like to save the notebook with a different name?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                )
-                
-                if change_name == QMessageBox.StandardButton.Yes:
-                    new_name, ok = self.prompt_for_text(
-                        "New Name",
-                        "Enter a new name for the notebook:",
-                        initial_text=self.notebook.name
-                    )
-                    if not ok or not new_name:
-                        new_name = None
-                
-                # Save the notebook to the selected directory
-                file_path = self.storage.save_notebook_as(self.notebook, directory, new_name)
-                
-                # Update the current notebook path
-                self.current_notebook_path = file_path
-                
-                # Add to recent notebooks list if it's not in the default directory
-                default_dir = self.config.get_default_storage_dir()
-                saved_name = new_name if new_name else self.notebook.name
-                if os.path.dirname(file_path) != default_dir:
-                    self.config.add_recent_notebook_location(file_path, saved_name)
-                
-                # Ask if user wants to set this as the default directory
-                set_default = QMessageBox.question(
-                    self,
-                    "Set Default Directory",
-                    "Would you like to set this as the default storage directory?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            # Optionally prompt for a new name
+            new_name = None
+            change_name = QMessageBox.question(
+                self,
+                "Change Name",
+                "Would you like to save the notebook with a different name?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            
+            if change_name == QMessageBox.StandardButton.Yes:
+                new_name, ok = self.prompt_for_text(
+                    "New Name",
+                    "Enter a new name for the notebook:",
+                    initial_text=self.notebook.name
                 )
-                
-                if set_default == QMessageBox.StandardButton.Yes:
-                    self.config.set_default_storage_dir(directory)
-                    self.storage.set_storage_directory(directory)
-                
-                QMessageBox.information(self, "Success", f"Notebook saved to {file_path}")
+                if not ok or not new_name:
+                    new_name = None
+            
+            try:
+                # Save the notebook to the selected directory on the storage worker
+                future = self.storage.save_notebook_as_async(self.notebook, directory, new_name)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to save notebook: {str(e)}")
+                return
+            
+            notebook = self.notebook
+            saved_name = new_name if new_name else notebook.name
+            self._track_save(
+                future, lambda file_path: self._finish_save_as(notebook, file_path, directory, saved_name)
+            )
+    
+    def _finish_save_as(self, notebook: Notebook, file_path: str, directory: str, saved_name: str):
+        """
+        Remember where a notebook was saved, once a background Save As succeeds.
+        
+        Args:
+            notebook: The notebook that was saved
+            file_path: Path to the saved notebook file
+            directory: Directory the notebook was saved to
+            saved_name: Name the notebook was saved under
+        """
+        # Update the current notebook path, unless another notebook was opened meanwhile
+        if notebook is self.notebook:
+            self.current_notebook_path = file_path
+        
+        # Add to recent notebooks list if it's not in the default directory
+        default_dir = self.config.get_default_storage_dir()
+        if os.path.dirname(file_path) != default_dir:
+            self.config.add_recent_notebook_location(file_path, saved_name)
+        
+        # Ask if user wants to set this as the default directory
+        set_default = QMessageBox.question(
+            self,
+            "Set Default Directory",
+            "Would you like to set this as the default storage directory?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        
+        if set_default == QMessageBox.StandardButton.Yes:
+            self.config.set_default_storage_dir(directory)
+            self.storage.set_storage_directory(directory)
+        
+        QMessageBox.information(self, "Success", f"Notebook saved to {file_path}")
     
     def set_default_storage_directory(self):
         """Set the default storage directory for notebooks."""
@@ -449,7 +759,7 @@ class NotebookUI(QMainWindow):
                 # Set the new storage directory
                 self.storage.set_storage_directory(directory)
                 self.config.set_default_storage_dir(directory)
-                self.status_bar.showMessage(f"Default storage directory set to: {directory}")
+                self._set_status(f"Default storage directory set to: {directory}")
                 
                 # Ask if user wants to move existing notebooks
                 move_notebooks = QMessageBox.question(
@@ -497,6 +807,39 @@ class NotebookUI(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to set storage directory: {str(e)}")
     
+    def _set_search_notebook(self, index_path: Optional[str] = None):
+        """
+        Search the current notebook, indexing it in the background first.
+        
+        Args:
+            index_path: Optional index saved with the notebook, reused for
+                pages not modified since
+        """
+        self.search_engine.set_notebook(self.notebook)
+        
+        # Search is unavailable until the index is built
+        self._index_seq += 1
+        self._set_search_enabled(False)
+        task = _IndexTask(self.search_engine, self._index_seq, index_path)
+        task.signals.finished.connect(self._on_indexing_done)
+        QThreadPool.globalInstance().start(task)
+    
+    def _save_search_index(self, notebook: Notebook, file_path: str):
+        """Save the search index next to a notebook just saved, if it still indexes that notebook."""
+        if self.search_engine.notebook is notebook:
+            task = _SaveIndexTask(self.search_engine, self.storage.get_index_path(file_path))
+            QThreadPool.globalInstance().start(task)
+    
+    def _on_indexing_done(self, seq: int):
+        """Make search available once the current notebook is indexed."""
+        if seq == self._index_seq:
+            self._set_search_enabled(True)
+    
+    def _set_search_enabled(self, enabled: bool):
+        """Enable or disable the search actions."""
+        self.search_notebook_action.setEnabled(enabled)
+        self.toolbar_search_action.setEnabled(enabled)
+    
     def create_new_page(self):
         """Create a new page in the notebook."""
         if not self.notebook:
@@ -508,11 +851,12 @@ class NotebookUI(QMainWindow):
         if ok:
             # Create the page
             page = self.notebook.create_page(name=name)
+            self.search_engine.invalidate_page(page.page_id)
             
             # Update the UI
-            self.update_pages_list()
+            self.pages_model.page_added(page)
             self.select_page(page.page_id)
-            self.status_bar.showMessage(f"Created new page: {page.name}")
+            self._set_status(f"Created new page: {page.name}")
     
     def rename_current_page(self):
         """Rename the current page."""
@@ -526,11 +870,12 @@ class NotebookUI(QMainWindow):
         if ok and name:
             # Rename the page
             self.current_page.rename(name)
+            self.search_engine.invalidate_page(self.current_page.page_id)
             
             # Update the UI
-            self.update_pages_list()
-            self.select_page(self.current_page.page_id)
-            self.status_bar.showMessage(f"Renamed page to: {name}")
+            self.pages_model.page_renamed(self.current_page.page_id)
+            self.page_view.update_page_name()
+            self._set_status(f"Renamed page to: {name}")
     
     def delete_current_page(self):
         """Delete the current page."""
@@ -538,25 +883,32 @@ class NotebookUI(QMainWindow):
             QMessageBox.warning(self, "No Page Selected", "Please select a page to delete.")
             return
         
-        # Confirm deletion
-        response = QMessageBox.question(
-            self, "Confirm Delete", 
-            f"Are you sure you want to delete the page '{self.current_page.name}'?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
+        # Confirm deletion; the answer arrives in _on_confirm_delete
+        self._pending_delete_id = self.current_page.page_id
+        self._confirm_box.setText(f"Are you sure you want to delete the page '{self.current_page.name}'?")
+        self._confirm_box.open()
+    
+    def _on_confirm_delete(self, button):
+        """Delete the page waiting for confirmation if the user confirmed it."""
+        page_id, self._pending_delete_id = self._pending_delete_id, None
+        if self._confirm_box.standardButton(button) != QMessageBox.StandardButton.Yes:
+            return
+        if not self.notebook or page_id not in self.notebook.pages:
+            return
         
-        if response == QMessageBox.StandardButton.Yes:
-            page_id = self.current_page.page_id
-            page_name = self.current_page.name
-            
-            # Delete the page
-            self.notebook.delete_page(page_id)
+        page_name = self.notebook.get_page(page_id).name
+        
+        # Delete the page
+        self.notebook.delete_page(page_id)
+        self.search_engine.invalidate_page(page_id)
+        if self.current_page is not None and self.current_page.page_id == page_id:
             self.current_page = None
-            
-            # Update the UI
-            self.update_pages_list()
+            self._show_page_timer.stop()
             self.page_view.clear()
-            self.status_bar.showMessage(f"Deleted page: {page_name}")
+        
+        # Update the UI
+        self.pages_model.page_removed(page_id)
+        self._set_status(f"Deleted page: {page_name}")
     
     def toggle_sidebar(self):
         """Toggle the visibility of the sidebar."""
@@ -571,7 +923,30 @@ class NotebookUI(QMainWindow):
             QMessageBox.warning(self, "No Notebook", "Please create or open a notebook first.")
             return
         
-        # Create a search dialog
+        # Wait for indexing to finish, as the disabled search actions do
+        if not self.search_notebook_action.isEnabled():
+            return
+        
+        self._flush_content()
+        
+        # Build the search dialog once, and start each search from a blank query
+        if self._search_dialog is None:
+            self._search_dialog = self._create_search_dialog()
+        dialog = self._search_dialog
+        dialog.search_timer.stop()
+        dialog.search_input.clear()
+        dialog.results_model.set_results([])
+        dialog.search_input.setFocus()
+        
+        # Show the dialog
+        dialog.exec()
+        
+        # Drop the results of a search still running when the dialog closed
+        dialog.search_timer.stop()
+        self._search_seq += 1
+    
+    def _create_search_dialog(self) -> QDialog:
+        """Create the search dialog, keeping its inputs as attributes for reuse."""
         dialog = QDialog(self)
         dialog.setWindowTitle("Search Notebook")
         dialog.setMinimumWidth(600)
@@ -587,7 +962,10 @@ class NotebookUI(QMainWindow):
         layout.addLayout(search_layout)
         
         # Results list
-        results_list = QListWidget()
+        results_model = SearchResultsModel(dialog)
+        results_list = QListView()
+        results_list.setModel(results_model)
+        _configure_list_view(results_list)
         layout.addWidget(QLabel("Results:"))
         layout.addWidget(results_list)
         
@@ -596,37 +974,61 @@ class NotebookUI(QMainWindow):
         close_button.clicked.connect(dialog.close)
         layout.addWidget(close_button)
         
-        # Connect the search functionality
+        # Search once typing pauses, rather than on every keystroke
+        search_timer = QTimer(dialog)
+        search_timer.setSingleShot(True)
+        search_timer.setInterval(200)
+        
+        # While typing, show pages matching the words so far from the index
+        def show_matching_pages():
+            search_timer.stop()
+            
+            # Supersede any full search still running
+            self._search_seq += 1
+            
+            query = search_input.text().strip()
+            results_model.set_results(self.search_engine.prefix_search(query, limit=200) if query else [])
+        
+        # On Enter or the Search button, search the full text of every page
         def perform_search():
+            search_timer.stop()
+            
+            # Supersede any search still running
+            self._search_seq += 1
+            
             query = search_input.text().strip()
             if not query:
+                results_model.set_results([])
                 return
             
-            # Clear previous results
-            results_list.clear()
-            
-            # Perform the search
-            search_results = self.search_engine.basic_search(query)
+            # Run the search off the UI thread
+            task = _SearchTask(self.search_engine, query, self._search_seq)
+            task.signals.finished.connect(show_results)
+            QThreadPool.globalInstance().start(task)
+        
+        def show_results(seq, search_results):
+            if seq != self._search_seq:
+                return
             
-            # Display results
-            for result in search_results:
-                item = QListWidgetItem(f"{result.page.name} - {result.match_count} matches")
-                item.setData(Qt.ItemDataRole.UserRole, result.page.page_id)
-                results_list.addItem(item)
+            results_model.set_results(search_results)
         
+        search_timer.timeout.connect(show_matching_pages)
+        search_input.textChanged.connect(lambda _: search_timer.start())
         search_button.clicked.connect(perform_search)
         search_input.returnPressed.connect(perform_search)
         
         # Connect result selection
-        def on_result_selected(item):
-            page_id = item.data(Qt.ItemDataRole.UserRole)
+        def on_result_selected(index):
+            page_id = index.data(Qt.ItemDataRole.UserRole)
             dialog.close()
             self.select_page(page_id)
         
-        results_list.itemDoubleClicked.connect(on_result_selected)
+        results_list.doubleClicked.connect(on_result_selected)
         
-        # Show the dialog
-        dialog.exec()
+        dialog.search_input = search_input
+        dialog.search_timer = search_timer
+        dialog.results_model = results_model
+        return dialog
     
     def show_word_count_analysis(self):
         """Show word count analysis for the notebook."""
@@ -634,14 +1036,7 @@ class NotebookUI(QMainWindow):
             QMessageBox.warning(self, "No Notebook", "Please create or open a notebook first.")
             return
         
-        # For now, just show basic word count stats
-        total_words = 0
-        page_counts = {}
-        
-        for page_id, page in self.notebook.pages.items():
-            words = len(page.content.split())
-            total_words += words
-            page_counts[page.name] = words
+        self._flush_content()
         
         # Create a dialog to display the results
         dialog = QDialog(self)
@@ -649,30 +1044,48 @@ class NotebookUI(QMainWindow):
         dialog.setMinimumWidth(400)
         layout = QVBoxLayout(dialog)
         
-        layout.addWidget(QLabel(f"Total Words: {total_words}"))
+        total_label = QLabel("Counting words...")
+        layout.addWidget(total_label)
         layout.addWidget(QLabel("Words per Page:"))
         
-        for name, count in page_counts.items():
-            layout.addWidget(QLabel(f"{name}: {count} words"))
+        # One list view for all pages, which only lays out the visible rows
+        counts_model = QStringListModel(dialog)
+        counts_list = QListView()
+        counts_list.setModel(counts_model)
+        counts_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        _configure_list_view(counts_list)
+        layout.addWidget(counts_list)
         
         close_button = QPushButton("Close")
         close_button.clicked.connect(dialog.close)
         layout.addWidget(close_button)
         
+        # Count on a worker thread, as pages not yet read come from disk;
+        # the dialog is modal, so the pages cannot change meanwhile
+        def show_counts(total_words, counts):
+            page_counts = dict(counts)
+            total_label.setText(f"Total Words: {total_words}")
+            counts_model.setStringList([f"{name}: {count} words" for name, count in page_counts.items()])
+        
+        task = _WordCountTask(self._word_counter, list(self.notebook.pages.values()))
+        task.signals.finished.connect(show_counts)
+        QThreadPool.globalInstance().start(task)
+        
         dialog.exec()
     
     def update_pages_list(self):
         """Update the list of pages in the sidebar."""
-        self.pages_list.clear()
-        if self.notebook:
-            for page in self.notebook.list_pages():
-                item = QListWidgetItem(page.name)
-                item.setData(Qt.ItemDataRole.UserRole, page.page_id)
-                self.pages_list.addItem(item)
-    
-    def on_page_selected(self, item):
+        # Lay out and paint the list once, after all rows have changed
+        self.pages_list.setUpdatesEnabled(False)
+        try:
+            self.pages_model.set_notebook(self.notebook)
+        finally:
+            self.pages_list.setUpdatesEnabled(True)
+            self.pages_list.viewport().update()
+    
+    def on_page_selected(self, index):
         """Handle selection of a page in the list."""
-        page_id = item.data(Qt.ItemDataRole.UserRole)
+        page_id = index.data(Qt.ItemDataRole.UserRole)
         self.select_page(page_id)
     
     def select_page(self, page_id):
@@ -680,40 +1093,95 @@ class NotebookUI(QMainWindow):
         if not self.notebook:
             return
         
+        # The page is already displayed and selected
+        if self.current_page is not None and self.current_page is self.notebook.pages.get(page_id):
+            return
+        
+        # Write pending edits to the page they were made on
+        self._flush_content()
+        
         try:
             # Get the page
             page = self.notebook.get_page(page_id)
             self.current_page = page
             
-            # Display the page in the page view
-            self.page_view.set_page(page)
+            # Display the page in the page view once the selection has
+            # painted; until then the editor still shows the previous page,
+            # so keep edits out of it
+            self.page_view.set_readonly(True)
+            self._show_page_timer.start()
             
             # Update the status bar
-            self.status_bar.showMessage(f"Page: {page.name}")
+            self._set_status(f"Page: {page.name}")
             
-            # Select the page in the list
-            for i in range(self.pages_list.count()):
-                item = self.pages_list.item(i)
-                if item.data(Qt.ItemDataRole.UserRole) == page_id:
-                    self.pages_list.setCurrentItem(item)
-                    break
+            # Select the page in the list; this cannot re-enter select_page,
+            # since the view's clicked signal only fires for mouse clicks
+            index = self.pages_model.index_of(page_id)
+            if index.isValid() and index != self.pages_list.currentIndex():
+                self.pages_list.setCurrentIndex(index)
         except KeyError:
             QMessageBox.warning(self, "Error", f"Could not find page with ID {page_id}")
     
-    def on_page_content_changed(self, content):
+    def _show_current_page(self):
+        """Display the current page in the page view."""
+        if self.current_page is not None:
+            self.page_view.set_page(self.current_page)
+    
+    def on_page_content_changed(self, position, removed, inserted):
         """Handle changes to the page content."""
         if self.current_page:
-            self.current_page.update_content(content)
+            # Merge typing at the end of the last change into that change
+            if self._pending_deltas and not removed:
+                last_position, last_removed, last_inserted = self._pending_deltas[-1]
+                if position == last_position + len(last_inserted):
+                    self._pending_deltas[-1] = (last_position, last_removed, last_inserted + inserted)
+                    self._content_debounce.start()
+                    return
+            
+            # Restart the timer, so a burst of changes is applied once
+            self._pending_deltas.append((position, removed, inserted))
+            self._content_debounce.start()
+    
+    def _flush_content(self):
+        """Apply pending editor changes to the current page."""
+        self._content_debounce.stop()
+        deltas, self._pending_deltas = self._pending_deltas, []
+        if deltas and self.current_page:
+            for position, removed, inserted in deltas:
+                self.current_page.apply_delta(position, removed, inserted)
+            self.search_engine.invalidate_page(self.current_page.page_id)
+    
+    def closeEvent(self, event):
+        """Write pending edits to the page, and wait for a save, before the window closes."""
+        self._flush_content()
+        if self._pending_save is not None:
+            wait([self._pending_save])
+        super().closeEvent(event)
     
     def prompt_for_text(self, title, message, initial_text=""):
         """Show a dialog to prompt for text input."""
-        dialog = QDialog(self)
+        # Build the prompt dialog once and fill it in for each prompt
+        if self._prompt_dialog is None:
+            self._prompt_dialog = self._create_prompt_dialog()
+        dialog = self._prompt_dialog
         dialog.setWindowTitle(title)
+        dialog.message_label.setText(message)
+        dialog.input_field.setText(initial_text)
+        dialog.input_field.selectAll()
+        dialog.input_field.setFocus()
+        
+        result = dialog.exec()
+        return dialog.input_field.text().strip(), result == QDialog.DialogCode.Accepted
+    
+    def _create_prompt_dialog(self) -> QDialog:
+        """Create the text prompt dialog, keeping its inputs as attributes for reuse."""
+        dialog = QDialog(self)
         layout = QFormLayout(dialog)
         
         # Input field
-        input_field = QLineEdit(initial_text)
-        layout.addRow(message, input_field)
+        message_label = QLabel()
+        input_field = QLineEdit()
+        layout.addRow(message_label, input_field)
         
         # Buttons
         buttons = QDialogButtonBox(
@@ -723,9 +1191,9 @@ class NotebookUI(QMainWindow):
         buttons.rejected.connect(dialog.reject)
         layout.addWidget(buttons)
         
-        result = dialog.exec()
-        return input_field.text().strip(), result == QDialog.DialogCode.Accepted
-
+        dialog.message_label = message_label
+        dialog.input_field = input_field
+        return dialog
 
 def run_application():
     """Run the Digital Notebook application."""
@@ -5,13 +5,22 @@ This module provides a widget for displaying and editing notebook pages.
 """
 from typing import Optional
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QHBoxLayout, QLabel
-from PyQt6.QtCore import pyqtSignal, Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPlainTextEdit, QHBoxLayout, QLabel
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, Qt
+from PyQt6.QtGui import QFont, QTextCursor
 
 from src.core.page import Page
 
 
+# Characters QTextDocument.toPlainText() replaces, and their replacements
+_PLAIN_TEXT_TABLE = str.maketrans({"\u2029": "\n", "\u2028": "\n", "\u00a0": " "})
+
+
+def _has_astral(text: str) -> bool:
+    """Check whether text has characters outside the Basic Multilingual Plane."""
+    return not text.isascii() and max(text) > "\uffff"
+
+
 class PageView(QWidget):
     """
     Widget for displaying and editing a notebook page.
@@ -19,8 +28,9 @@ class PageView(QWidget):
     This class provides a text editor for the page content and displays the page name.
     """
     
-    # Signal emitted when page content changes
-    content_changed = pyqtSignal(str)
+    # Signal emitted when page content changes, with the position of the
+    # change, the number of characters removed there and the text inserted
+    content_changed = pyqtSignal(int, int, str)
     
     def __init__(self):
         """Initialize the page view."""
@@ -29,6 +39,14 @@ class PageView(QWidget):
         # Current page being displayed
         self.page: Optional[Page] = None
         
+        # Length of the editor text, and whether document positions, which
+        # count UTF-16 code units, are also positions in the Python string
+        self._length = 0
+        self._positions_match = True
+        
+        # Whether the editor is being filled with a page, rather than edited
+        self._loading = False
+        
         # Set up the UI
         self.init_ui()
     
@@ -48,10 +66,11 @@ class PageView(QWidget):
         header_layout.addStretch()
         layout.addLayout(header_layout)
         
-        # Add text editor for page content
-        self.text_editor = QTextEdit()
+        # Add text editor for page content; a plain text editor only lays out
+        # the paragraphs it shows, so long pages open without a full layout
+        self.text_editor = QPlainTextEdit()
         self.text_editor.setPlaceholderText("Select a page to start writing...")
-        self.text_editor.textChanged.connect(self.on_text_changed)
+        self.text_editor.document().contentsChange.connect(self.on_contents_change)
         layout.addWidget(self.text_editor)
         
         # Set margins and spacing
@@ -70,14 +89,24 @@ class PageView(QWidget):
         # Update the UI
         self.page_name_label.setText(page.name)
         
-        # Temporarily disconnect the signal to avoid triggering content_changed
-        self.text_editor.textChanged.disconnect(self.on_text_changed)
-        self.text_editor.setPlainText(page.content)
-        self.text_editor.textChanged.connect(self.on_text_changed)
+        # Fill the editor without reporting the new text as a change; the
+        # document's signals stay unblocked, since the editor relies on them
+        self._loading = True
+        try:
+            self.text_editor.setPlainText(page.content)
+        finally:
+            self._loading = False
+        self._length = len(page.content)
+        self._positions_match = not _has_astral(page.content)
         
         # Enable editing
         self.text_editor.setReadOnly(False)
     
+    def update_page_name(self):
+        """Show the current name of the displayed page, after it was renamed."""
+        if self.page:
+            self.page_name_label.setText(self.page.name)
+    
     def clear(self):
         """Clear the page view."""
         self.page = None
@@ -86,11 +115,38 @@ class PageView(QWidget):
         self.text_editor.setPlaceholderText("Select a page to start writing...")
         self.text_editor.setReadOnly(True)
     
-    def on_text_changed(self):
-        """Handle changes to the text editor content."""
-        if self.page:
+    @pyqtSlot(int, int, int)
+    def on_contents_change(self, position: int, chars_removed: int, chars_added: int):
+        """Handle a change to the text editor content, emitting only the changed text."""
+        if not self.page or self._loading:
+            return
+        
+        document = self.text_editor.document()
+        length = document.characterCount() - 1
+        
+        # The document counts its final paragraph separator, which some
+        # changes include in their counts, so clamp them to the text
+        removed = min(chars_removed, self._length - position)
+        added = min(chars_added, length - position)
+        
+        inserted = None
+        if self._positions_match and 0 <= position and self._length - removed + added == length:
+            cursor = QTextCursor(document)
+            cursor.setPosition(position)
+            cursor.setPosition(position + added, QTextCursor.MoveMode.KeepAnchor)
+            inserted = cursor.selectedText().translate(_PLAIN_TEXT_TABLE)
+            if _has_astral(inserted):
+                self._positions_match = False
+                inserted = None
+        
+        if inserted is None:
+            # Positions cannot be trusted, so replace the whole content
             content = self.text_editor.toPlainText()
-            self.content_changed.emit(content)
+            self.content_changed.emit(0, self._length, content)
+            self._length = len(content)
+        else:
+            self.content_changed.emit(position, removed, inserted)
+            self._length = length
     
     def get_content(self) -> str:
         """
@@ -108,7 +164,10 @@ class PageView(QWidget):
         Args:
             content: Text content to set
         """
+        # Reported as replacing the whole content
+        self._positions_match = False
         self.text_editor.setPlainText(content)
+        self._positions_match = not _has_astral(content)
     
     def set_readonly(self, readonly: bool):
         """
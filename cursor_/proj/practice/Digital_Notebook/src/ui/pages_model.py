@@ -0,0 +1,215 @@
+"""
+Pages Model module for the Digital Notebook.
+
+This module provides the list model behind the sidebar's list of pages.
+"""
+from typing import Any, Dict, List, Optional
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from src.core.notebook import Notebook
+from src.core.page import Page
+
+
+class PagesModel(QAbstractListModel):
+    """
+    List model exposing the pages of a notebook.
+    
+    Each row is a page, displayed by name and carrying its page ID in the
+    user role. Rows are kept in page ID order, like Notebook.list_pages().
+    """
+    
+    def __init__(self, parent=None):
+        """
+        Initialize an empty pages model.
+        
+        Args:
+            parent: Optional parent object
+        """
+        super().__init__(parent)
+        
+        self._notebook: Optional[Notebook] = None
+        self._pages: List[Page] = []
+        
+        # Names as last shown, to tell which rows a rename changed
+        self._names: List[str] = []
+        
+        # Row of each page ID, rebuilt on demand after rows move
+        self._rows: Optional[Dict[int, int]] = None
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get the number of pages in the model."""
+        if parent.isValid():
+            return 0
+        return len(self._pages)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Get the name or page ID of the page in a row."""
+        if not index.isValid():
+            return None
+        
+        page = self._pages[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return page.name
+        if role == Qt.ItemDataRole.UserRole:
+            return page.page_id
+        return None
+    
+    def set_notebook(self, notebook: Optional[Notebook]) -> None:
+        """
+        Show the pages of a notebook.
+        
+        Switching to another notebook resets the model; for the notebook
+        already shown, only the rows that changed are updated.
+        
+        Args:
+            notebook: Notebook to show, or None to show no pages
+        """
+        if notebook is not self._notebook:
+            self.beginResetModel()
+            self._notebook = notebook
+            self._pages = notebook.list_pages() if notebook else []
+            self._names = [page.name for page in self._pages]
+            self._rows = None
+            self.endResetModel()
+        else:
+            self.refresh()
+    
+    def refresh(self) -> None:
+        """Update the rows for pages created, renamed or deleted since the last update."""
+        pages = self._notebook.list_pages() if self._notebook else []
+        current = {id(page) for page in pages}
+        
+        # Remove rows of deleted pages, one range per run of adjacent rows,
+        # from the bottom so row numbers stay valid
+        row = len(self._pages)
+        while row > 0:
+            row -= 1
+            if id(self._pages[row]) in current:
+                continue
+            last = row
+            while row > 0 and id(self._pages[row - 1]) not in current:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row, last)
+            self._forget_rows(row, last)
+            del self._pages[row:last + 1]
+            del self._names[row:last + 1]
+            self.endRemoveRows()
+        
+        # The remaining rows are in page order, so walking the pages inserts
+        # each run of new pages at its rows and finds every renamed one
+        row = 0
+        while row < len(pages):
+            page = pages[row]
+            if row < len(self._pages) and self._pages[row] is page:
+                if self._names[row] != page.name:
+                    self._names[row] = page.name
+                    index = self.index(row)
+                    self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+                row += 1
+                continue
+            
+            # New pages run up to the next page already shown
+            next_shown = self._pages[row] if row < len(self._pages) else None
+            end = row + 1
+            while end < len(pages) and pages[end] is not next_shown:
+                end += 1
+            self.beginInsertRows(QModelIndex(), row, end - 1)
+            self._pages[row:row] = pages[row:end]
+            self._names[row:row] = [page.name for page in pages[row:end]]
+            self._note_rows(row, end - 1)
+            self.endInsertRows()
+            row = end
+    
+    def page_added(self, page: Page) -> None:
+        """
+        Show a page just created in the notebook.
+        
+        Args:
+            page: The new page
+        """
+        # New pages get the highest ID, so their row is normally the last
+        if self._pages and self._pages[-1].page_id > page.page_id:
+            self.refresh()
+            return
+        
+        row = len(self._pages)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._pages.append(page)
+        self._names.append(page.name)
+        self._note_rows(row, row)
+        self.endInsertRows()
+    
+    def page_renamed(self, page_id: int) -> None:
+        """
+        Show the new name of a renamed page.
+        
+        Args:
+            page_id: ID of the renamed page
+        """
+        index = self.index_of(page_id)
+        if not index.isValid():
+            return
+        
+        self._names[index.row()] = self._pages[index.row()].name
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+    
+    def page_removed(self, page_id: int) -> None:
+        """
+        Remove the row of a page deleted from the notebook.
+        
+        Args:
+            page_id: ID of the deleted page
+        """
+        index = self.index_of(page_id)
+        if not index.isValid():
+            return
+        
+        row = index.row()
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._forget_rows(row, row)
+        del self._pages[row]
+        del self._names[row]
+        self.endRemoveRows()
+    
+    def _note_rows(self, first: int, last: int) -> None:
+        """Update the row index for rows just inserted."""
+        if self._rows is None:
+            return
+        
+        # Pages appended at the end leave every other row in place
+        if last == len(self._pages) - 1:
+            for row in range(first, last + 1):
+                self._rows[self._pages[row].page_id] = row
+        else:
+            self._rows = None
+    
+    def _forget_rows(self, first: int, last: int) -> None:
+        """Update the row index for rows about to be removed."""
+        if self._rows is None:
+            return
+        
+        # Rows removed from the end leave every other row in place
+        if last == len(self._pages) - 1:
+            for row in range(first, last + 1):
+                del self._rows[self._pages[row].page_id]
+        else:
+            self._rows = None
+    
+    def index_of(self, page_id: int) -> QModelIndex:
+        """
+        Get the model index of a page.
+        
+        Args:
+            page_id: ID of the page
+            
+        Returns:
+            Index of the page's row, or an invalid index if it is not shown
+        """
+        if self._rows is None:
+            self._rows = {page.page_id: row for row, page in enumerate(self._pages)}
+        
+        row = self._rows.get(page_id)
+        if row is None:
+            return QModelIndex()
+        return self.index(row)
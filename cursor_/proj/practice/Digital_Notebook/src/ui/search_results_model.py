@@ -0,0 +1,78 @@
+"""
+Search Results Model module for the Digital Notebook.
+
+This module provides the list model behind the search dialog's results.
+"""
+from typing import Any, List, Optional
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from src.utils.search import SearchResult
+
+
+# Longest row label shown; longer labels are cut off with an ellipsis
+_MAX_LABEL_LENGTH = 160
+
+
+class SearchResultsModel(QAbstractListModel):
+    """
+    List model exposing search results.
+    
+    Each row is a result, displayed as the page name and match snippet on a
+    single line and carrying the page ID in the user role. Rows are formatted
+    only when the view asks for them.
+    """
+    
+    def __init__(self, parent=None):
+        """
+        Initialize an empty results model.
+        
+        Args:
+            parent: Optional parent object
+        """
+        super().__init__(parent)
+        
+        self._results: List[SearchResult] = []
+        
+        # Row labels, formatted the first time each row is shown
+        self._labels: List[Optional[str]] = []
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get the number of results in the model."""
+        if parent.isValid():
+            return 0
+        return len(self._results)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Get the label or page ID of the result in a row."""
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            label = self._labels[row]
+            if label is None:
+                label = self._labels[row] = self._format_label(self._results[row])
+            return label
+        if role == Qt.ItemDataRole.UserRole:
+            return self._results[row].page.page_id
+        return None
+    
+    def _format_label(self, result: SearchResult) -> str:
+        """Format the label of a result on one line of bounded length, so rows share a size."""
+        label = " ".join(f"{result.page.name}: {result.content_snippet}".split())
+        if len(label) > _MAX_LABEL_LENGTH:
+            label = label[:_MAX_LABEL_LENGTH - 1] + "\u2026"
+        return label
+    
+    def set_results(self, results: List[SearchResult]) -> None:
+        """
+        Replace the results shown.
+        
+        Args:
+            results: Search results to show, in display order
+        """
+        self.beginResetModel()
+        self._results = results
+        self._labels = [None] * len(results)
+        self.endResetModel()
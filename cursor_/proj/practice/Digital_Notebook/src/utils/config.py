@@ -5,10 +5,17 @@ This module provides functionality for saving and loading user preferences.
 """
 import json
 import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict
 
 
+# Default directory for the configuration file and notebooks, in the user's
+# home directory; resolved once rather than on every lookup
+_DEFAULT_DIR = os.path.join(str(Path.home()), '.digital_notebook')
+_DEFAULT_CONFIG_FILE = os.path.join(_DEFAULT_DIR, 'config.json')
+
+
 class Config:
     """
     Manages application configuration and preferences.
@@ -30,15 +37,20 @@ class Config:
         """
         if config_file is None:
             # Use a default location in the user's home directory
-            self.config_file = os.path.join(str(Path.home()), '.digital_notebook', 'config.json')
+            self.config_file = _DEFAULT_CONFIG_FILE
         else:
             self.config_file = config_file
         
         # Make sure the directory exists
-        os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+        config_dir = os.path.dirname(self.config_file)
+        if not os.path.isdir(config_dir):
+            os.makedirs(config_dir, exist_ok=True)
         
         # Load the configuration
         self.config = self._load_config()
+        
+        # Whether the configuration has changes not yet written to the file
+        self._dirty = False
     
     def _load_config(self) -> dict:
         """Load the configuration from the file."""
@@ -52,10 +64,18 @@ class Config:
         return {}
     
     def save_config(self) -> None:
-        """Save the configuration to the file."""
+        """Save the configuration to the file, if it has unsaved changes."""
+        if not self._dirty:
+            return
+        
         try:
-            with open(self.config_file, 'w') as f:
+            # Write a temporary file and swap it in, so an interrupted
+            # write never leaves a truncated configuration behind
+            temp_file = self.config_file + '.tmp'
+            with open(temp_file, 'w') as f:
                 json.dump(self.config, f, indent=4)
+            os.replace(temp_file, self.config_file)
+            self._dirty = False
         except IOError as e:
             print(f"Error saving configuration: {str(e)}")
     
@@ -72,16 +92,21 @@ class Config:
         """
         return self.config.get(key, default)
     
-    def set(self, key: str, value) -> None:
+    def set(self, key: str, value, defer_save: bool = False) -> None:
         """
         Set a configuration value and save the configuration.
         
         Args:
             key: The key to set
             value: The value to store
+            defer_save: If True, only mark the configuration as changed, so
+                        several values can be set and saved with one
+                        save_config call
         """
         self.config[key] = value
-        self.save_config()
+        self._dirty = True
+        if not defer_save:
+            self.save_config()
     
     def get_default_storage_dir(self) -> str:
         """
@@ -90,8 +115,7 @@ class Config:
         Returns:
             The configured storage directory or the default
         """
-        default_dir = os.path.join(str(Path.home()), '.digital_notebook')
-        return self.get('storage_dir', default_dir)
+        return self.get('storage_dir', _DEFAULT_DIR)
     
     def set_default_storage_dir(self, directory: str) -> None:
         """
@@ -115,28 +139,31 @@ class Config:
         """
         Add a notebook file path to the recent notebooks list.
         
-        This maintains the list of recent notebooks up to MAX_RECENT_NOTEBOOKS.
+        The notebook becomes the most recent one, and the list of recent
+        notebooks is kept to MAX_RECENT_NOTEBOOKS by dropping the oldest.
         
         Args:
             file_path: The full path to the notebook file
             notebook_name: The name of the notebook
         """
-        recent_notebooks = self.get_recent_notebook_locations()
+        recent_notebooks = OrderedDict(self.get_recent_notebook_locations())
+        
+        # Nothing to write if the notebook is already the most recent one,
+        # under this name
+        most_recent = next(reversed(recent_notebooks), None)
+        if most_recent == file_path and recent_notebooks[most_recent] == notebook_name:
+            return
         
-        # Add or update the notebook in the dictionary
+        # Add or update the notebook, as the most recent one
         recent_notebooks[file_path] = notebook_name
+        recent_notebooks.move_to_end(file_path)
         
         # If we have more than the maximum number, remove the oldest ones
-        if len(recent_notebooks) > self.MAX_RECENT_NOTEBOOKS:
-            # Convert to a list of (path, name) tuples
-            paths = list(recent_notebooks.items())
-            # Keep only the most recent ones
-            paths = paths[-self.MAX_RECENT_NOTEBOOKS:]
-            # Convert back to dictionary
-            recent_notebooks = dict(paths)
+        while len(recent_notebooks) > self.MAX_RECENT_NOTEBOOKS:
+            recent_notebooks.popitem(last=False)
         
         # Save the updated list
-        self.set('recent_notebooks', recent_notebooks)
+        self.set('recent_notebooks', dict(recent_notebooks))
     
     def remove_recent_notebook_location(self, file_path: str) -> None:
         """
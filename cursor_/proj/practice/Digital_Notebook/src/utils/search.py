@@ -3,14 +3,78 @@ Search module for the Digital Notebook.
 
 This module provides search functionality for finding content in the notebook.
 """
+import datetime
+import json
+import os
 import re
-from typing import List, Dict, Any, Optional, Tuple
+import threading
+from bisect import bisect_left
+from functools import lru_cache
+from typing import List, Dict, Any, Match, NamedTuple, Optional, Pattern, Set, Tuple
 from dataclasses import dataclass
 
+from src.analysis.word_counter import _tokenize
 from src.core.notebook import Notebook
 from src.core.page import Page
 
 
+# Words as indexed for prefix search
+_WORD_RE = re.compile(r"\w+")
+
+# Number of distinct queries whose prefix search results are memoized
+PREFIX_CACHE_SIZE = 64
+
+# Version of the file format written by SearchEngine.save_index
+_INDEX_FORMAT = 1
+
+# Number of distinct queries whose compiled patterns are kept
+PATTERN_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _query_pattern(query: str, case_sensitive: bool, whole_words: bool) -> Pattern[str]:
+    """
+    Compile the pattern matching a literal search query.
+    
+    Args:
+        query: The text to match
+        case_sensitive: Whether to match case
+        whole_words: Whether to only match the query as a whole word
+        
+    Returns:
+        The compiled pattern, shared between calls with the same arguments
+    """
+    expression = re.escape(query)
+    if whole_words:
+        expression = r'\b' + expression + r'\b'
+    return re.compile(expression, 0 if case_sensitive else re.IGNORECASE)
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _keywords_pattern(keywords: Tuple[str, ...]) -> Pattern[str]:
+    """
+    Compile one case-insensitive pattern matching any of several keywords as whole words.
+    
+    Each keyword is a numbered group, so match.lastindex - 1 is the position
+    of the keyword a match is for.
+    
+    Args:
+        keywords: Distinct lowercase ASCII words
+        
+    Returns:
+        The compiled pattern, shared between calls with the same keywords
+    """
+    alternatives = "|".join("(" + keyword + ")" for keyword in keywords)
+    return re.compile(r'\b(?:' + alternatives + r')\b', re.IGNORECASE)
+
+
+class _IndexedPage(NamedTuple):
+    """The words of a page as indexed, and the modification time of the page they were read from."""
+    words: Set[str]
+    is_ascii: bool
+    updated_at: datetime.datetime
+
+
 @dataclass
 class SearchResult:
     """Represents a search result from the notebook."""
@@ -37,6 +101,27 @@ class SearchEngine:
         """
         self.notebook = notebook
         self.context_size = 50  # Characters of context to include around matches
+        
+        # Inverted index for prefix_search: page IDs by lowercase word, the
+        # words indexed for each page, and the words in sorted order
+        self._postings: Optional[Dict[str, Set[int]]] = None
+        self._indexed_pages: Dict[int, _IndexedPage] = {}
+        self._vocabulary: Optional[List[str]] = None
+        
+        # Pages whose name or content is not all ASCII, where case-insensitive
+        # patterns can match text whose lowercase words do not show it
+        self._unicode_pages: Set[int] = set()
+        
+        # Pages changed since they were indexed
+        self._stale_pages: Set[int] = set()
+        
+        # Guards the index state above: the index is built, saved and
+        # searched on worker threads while the UI thread invalidates pages
+        self._index_lock = threading.RLock()
+        
+        # Memoized prefix search results, keyed on the query words and limit
+        # and discarded whenever the index changes
+        self._cached_prefix_search = lru_cache(maxsize=PREFIX_CACHE_SIZE)(self._prefix_search)
     
     def set_notebook(self, notebook: Notebook) -> None:
         """
@@ -45,7 +130,327 @@ class SearchEngine:
         Args:
             notebook: The notebook to search
         """
-        self.notebook = notebook
+        with self._index_lock:
+            self.notebook = notebook
+            self._postings = None
+            self._indexed_pages = {}
+            self._vocabulary = None
+            self._unicode_pages = set()
+            self._stale_pages = set()
+            self._cached_prefix_search.cache_clear()
+    
+    def build_index(self, index_path: Optional[str] = None) -> None:
+        """
+        Build the inverted index used by prefix_search and to narrow down other searches.
+        
+        The index is built from a copy of the page list and installed only if
+        the notebook has not been replaced meanwhile, so this may run on a
+        background thread. Pages invalidated while it runs are re-indexed by
+        the next prefix_search.
+        
+        Args:
+            index_path: Optional file written by save_index; the words saved
+                there are reused for pages not modified since, instead of
+                reading and tokenizing their content again
+        """
+        notebook = self.notebook
+        pages = list(notebook.pages.values()) if notebook is not None else []
+        saved = self._read_index(index_path) if index_path else {}
+        
+        indexed_pages: Dict[int, _IndexedPage] = {}
+        postings: Dict[str, Set[int]] = {}
+        unicode_pages: Set[int] = set()
+        for page in pages:
+            indexed = saved.get(page.page_id)
+            if indexed is None or indexed.updated_at != page.updated_at:
+                indexed = self._index_page(page)
+            indexed_pages[page.page_id] = indexed
+            for word in indexed.words:
+                postings.setdefault(word, set()).add(page.page_id)
+            if not indexed.is_ascii:
+                unicode_pages.add(page.page_id)
+        
+        with self._index_lock:
+            if self.notebook is notebook:
+                self._indexed_pages = indexed_pages
+                self._vocabulary = None
+                self._unicode_pages = unicode_pages
+                self._postings = postings
+                self._cached_prefix_search.cache_clear()
+    
+    def save_index(self, path: str) -> None:
+        """
+        Save the words of every indexed page to a file, for build_index to reuse.
+        
+        Each page is saved with the modification time it had when it was
+        indexed, so pages changed since are indexed again when the file is
+        used. Nothing is saved before the index is built. The index is copied
+        first, so this may run on a background thread.
+        
+        Args:
+            path: Path of the file to write
+            
+        Raises:
+            OSError: If the file cannot be written
+        """
+        with self._index_lock:
+            if self._postings is None:
+                return
+            indexed_pages = dict(self._indexed_pages)
+        
+        pages = {
+            str(page_id): [indexed.updated_at.isoformat(), sorted(indexed.words), indexed.is_ascii]
+            for page_id, indexed in indexed_pages.items()
+        }
+        
+        # Replace the file in one step, so a failed write leaves the old one;
+        # the temporary file is per thread, as saves may overlap
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as index_file:
+            json.dump({"format": _INDEX_FORMAT, "pages": pages}, index_file)
+        os.replace(temp_path, path)
+    
+    def _read_index(self, path: str) -> Dict[int, _IndexedPage]:
+        """Read the pages saved by save_index, or none if the file is missing or unreadable."""
+        try:
+            with open(path, encoding="utf-8") as index_file:
+                saved = json.load(index_file)
+            if saved.get("format") != _INDEX_FORMAT:
+                return {}
+            return {
+                int(page_id): _IndexedPage(set(words), is_ascii, datetime.datetime.fromisoformat(updated_at))
+                for page_id, (updated_at, words, is_ascii) in saved["pages"].items()
+            }
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return {}
+    
+    def invalidate_page(self, page_id: int) -> None:
+        """
+        Mark a page as created, changed or deleted since it was indexed.
+        
+        Args:
+            page_id: ID of the page
+        """
+        with self._index_lock:
+            self._stale_pages.add(page_id)
+            self._cached_prefix_search.cache_clear()
+    
+    def prefix_search(self, query: str, limit: int = 200) -> List[SearchResult]:
+        """
+        Find pages containing every word of a query, using the inverted index.
+        
+        Matching is case-insensitive and by word; the last word of the query
+        also matches longer words it starts, so results follow typing. Each
+        matching page gives one result, in page order. Results are memoized
+        until a page is invalidated, so repeating a query is a lookup.
+        
+        Args:
+            query: Words to search for
+            limit: Maximum number of results
+            
+        Returns:
+            List of SearchResult objects
+            
+        Raises:
+            ValueError: If no notebook has been set
+        """
+        if self.notebook is None:
+            raise ValueError("No notebook has been set for search")
+        
+        words = _WORD_RE.findall(query.lower())
+        if not words:
+            return []
+        
+        # Memoized results are only current if no page changed since
+        with self._index_lock:
+            if self._postings is not None:
+                self._find_changed_pages()
+        
+        return list(self._cached_prefix_search(tuple(words), limit))
+    
+    def _prefix_search(self, words: Tuple[str, ...], limit: int) -> List[SearchResult]:
+        """Find the pages containing lowercase query words, for prefix_search."""
+        with self._index_lock:
+            self._update_index()
+            
+            # Intersect the pages of each whole word with those of the prefix
+            prefix_pages: Set[int] = set()
+            for word in self._words_with_prefix(words[-1]):
+                prefix_pages |= self._postings[word]
+            page_ids = prefix_pages
+            for word in words[:-1]:
+                page_ids = page_ids & self._postings.get(word, set())
+        
+        results = []
+        for page_id in sorted(page_ids)[:limit]:
+            page = self.notebook.pages[page_id]
+            
+            # Show the first occurrence of the first word, or the name if
+            # the word only occurs there
+            start = page.lower_content.find(words[0])
+            if start >= 0:
+                end = start + len(words[0])
+                snippet = self._make_snippet(page.content, start, end)
+            else:
+                start = page.lower_name.find(words[0])
+                end = start + len(words[0])
+                snippet = f"[Page Name]: {page.name}"
+            
+            results.append(SearchResult(
+                page=page,
+                content_snippet=snippet,
+                match_start=start,
+                match_end=end,
+                relevance_score=1.0
+            ))
+        
+        return results
+    
+    def _candidate_pages(self, words: List[str], whole_words: bool) -> Set[int]:
+        """
+        Narrow down the pages a search for ASCII words can match, using the index.
+        
+        Every run of word characters in a match lies within a word of the
+        page, so a page can only match if each word of the query is one of
+        its words, or part of one unless whole words are searched for.
+        
+        Args:
+            words: Lowercase words of the query
+            whole_words: Whether the query words only match whole words
+            
+        Returns:
+            IDs of the pages that may match
+        """
+        with self._index_lock:
+            self._update_index()
+            
+            candidates: Optional[Set[int]] = None
+            for word in words:
+                if whole_words:
+                    page_ids = self._postings.get(word, set())
+                else:
+                    page_ids = set()
+                    for indexed, indexed_pages in self._postings.items():
+                        if word in indexed:
+                            page_ids |= indexed_pages
+                candidates = page_ids if candidates is None else candidates & page_ids
+                if not candidates:
+                    break
+            
+            return candidates | self._unicode_pages
+    
+    def _pages_to_search(self, query: str, whole_words: bool = False) -> List[Page]:
+        """
+        Get the pages a search can match, in notebook order.
+        
+        Queries with no words, or with non-ASCII text that case-insensitive
+        matching may equate with other characters, search every page.
+        
+        Args:
+            query: Text the search matches literally
+            whole_words: Whether each word of the query only matches whole words
+            
+        Returns:
+            Pages to search
+        """
+        words = _WORD_RE.findall(query.lower())
+        if not words or not query.isascii():
+            return list(self.notebook.pages.values())
+        
+        candidates = self._candidate_pages(words, whole_words)
+        return [page for page in self.notebook.pages.values() if page.page_id in candidates]
+    
+    @staticmethod
+    def _index_page(page: Page) -> _IndexedPage:
+        """
+        Get the lowercase words of a page's name and content, and whether both are all ASCII.
+        
+        Content not yet loaded is read without being kept, so indexing a
+        freshly opened notebook leaves the page contents on disk.
+        """
+        # Take the modification time first, so a change made while the page
+        # is read makes the saved words look out of date rather than current
+        updated_at = page.updated_at
+        content = page.read_content()
+        words = set(_tokenize(page.lower_name))
+        words.update(_tokenize(content.lower()))
+        return _IndexedPage(words, page.name.isascii() and content.isascii(), updated_at)
+    
+    def _find_changed_pages(self) -> None:
+        """
+        Mark the pages created, changed or deleted since they were indexed as stale.
+        
+        Pages are compared by modification time, as build_index compares them
+        with a saved index, so pages changed without invalidate_page are
+        found without reading any content. Memoized prefix searches are
+        discarded when any is found. Called with _index_lock held.
+        """
+        stale_count = len(self._stale_pages)
+        pages = self.notebook.pages
+        for page_id, page in pages.items():
+            indexed = self._indexed_pages.get(page_id)
+            if indexed is None or indexed.updated_at != page.updated_at:
+                self._stale_pages.add(page_id)
+        self._stale_pages.update(self._indexed_pages.keys() - pages.keys())
+        
+        if len(self._stale_pages) != stale_count:
+            self._cached_prefix_search.cache_clear()
+    
+    def _update_index(self) -> None:
+        """Build the index if needed, and re-index pages changed since; called with _index_lock held."""
+        if self._postings is None:
+            self.build_index()
+        else:
+            self._find_changed_pages()
+        
+        while self._stale_pages:
+            page_id = self._stale_pages.pop()
+            
+            # Remove the words the page had when it was indexed
+            self._unicode_pages.discard(page_id)
+            indexed = self._indexed_pages.pop(page_id, None)
+            for word in indexed.words if indexed else ():
+                page_ids = self._postings[word]
+                page_ids.discard(page_id)
+                if not page_ids:
+                    del self._postings[word]
+                    self._vocabulary = None
+            
+            # Add its current words, unless it was deleted
+            page = self.notebook.pages.get(page_id)
+            if page is None:
+                continue
+            indexed = self._index_page(page)
+            self._indexed_pages[page_id] = indexed
+            if not indexed.is_ascii:
+                self._unicode_pages.add(page_id)
+            for word in indexed.words:
+                page_ids = self._postings.get(word)
+                if page_ids is None:
+                    page_ids = self._postings[word] = set()
+                    self._vocabulary = None
+                page_ids.add(page_id)
+    
+    def _words_with_prefix(self, prefix: str) -> List[str]:
+        """Get the indexed words starting with a prefix; called with _index_lock held."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        
+        words = []
+        for i in range(bisect_left(self._vocabulary, prefix), len(self._vocabulary)):
+            word = self._vocabulary[i]
+            if not word.startswith(prefix):
+                break
+            words.append(word)
+        return words
+    
+    def _make_snippet(self, content: str, start: int, end: int) -> str:
+        """Extract the content around a match, marking cut-off ends with an ellipsis."""
+        content_start = max(0, start - self.context_size)
+        content_end = min(len(content), end + self.context_size)
+        prefix = "..." if content_start > 0 else ""
+        suffix = "..." if content_end < len(content) else ""
+        return prefix + content[content_start:content_end] + suffix
     
     def basic_search(self, query: str, case_sensitive: bool = False) -> List[SearchResult]:
         """
@@ -67,33 +472,17 @@ class SearchEngine:
         results = []
         
         # Prepare the search query
-        if not case_sensitive:
-            pattern = re.compile(re.escape(query), re.IGNORECASE)
-        else:
-            pattern = re.compile(re.escape(query))
+        pattern = _query_pattern(query, case_sensitive, False)
         
-        # Search through all pages
-        for page in self.notebook.pages.values():
+        # Search through the pages that may contain the query
+        for page in self._pages_to_search(query):
             # Search in the page content
-            for match in pattern.finditer(page.content):
+            content = page.content
+            for match in pattern.finditer(content):
                 start, end = match.span()
                 
                 # Extract a snippet of context around the match
-                content_start = max(0, start - self.context_size)
-                content_end = min(len(page.content), end + self.context_size)
-                
-                # Create the content snippet
-                if content_start > 0:
-                    prefix = "..."
-                else:
-                    prefix = ""
-                    
-                if content_end < len(page.content):
-                    suffix = "..."
-                else:
-                    suffix = ""
-                    
-                snippet = prefix + page.content[content_start:content_end] + suffix
+                snippet = self._make_snippet(content, start, end)
                 
                 # Calculate a simple relevance score (multiple matches in the same page rank higher)
                 score = 1.0
@@ -141,58 +530,42 @@ class SearchEngine:
         results = []
         
         # Prepare the search query
-        flags = 0 if case_sensitive else re.IGNORECASE
-        
-        if whole_words:
-            pattern = re.compile(r'\b' + re.escape(query) + r'\b', flags)
-        else:
-            pattern = re.compile(re.escape(query), flags)
+        pattern = _query_pattern(query, case_sensitive, whole_words)
         
-        # Search through all pages
-        for page in self.notebook.pages.values():
-            # Calculate page relevance score
-            page_score = 0.0
-            
-            # Search in the page content
-            content_matches = list(pattern.finditer(page.content))
-            page_score += len(content_matches) * 1.0
-            
-            # Search in the page name if requested
-            name_match = None
-            if include_page_names and pattern.search(page.name):
-                name_match = pattern.search(page.name)
-                page_score += 2.0  # Matches in titles are weighted more heavily
-            
-            # Process content matches
-            for match in content_matches:
+        # Search through the pages that may contain the query; the index
+        # holds the words of page names as well as of their content
+        for page in self._pages_to_search(query, whole_words):
+            # Process content matches as the search finds them; their score
+            # is only known once all of them are found, so it is set after
+            content = page.content
+            page_results = []
+            for match in pattern.finditer(content):
                 start, end = match.span()
                 
                 # Extract a snippet of context around the match
-                content_start = max(0, start - self.context_size)
-                content_end = min(len(page.content), end + self.context_size)
-                
-                # Create the content snippet
-                if content_start > 0:
-                    prefix = "..."
-                else:
-                    prefix = ""
-                    
-                if content_end < len(page.content):
-                    suffix = "..."
-                else:
-                    suffix = ""
-                    
-                snippet = prefix + page.content[content_start:content_end] + suffix
+                snippet = self._make_snippet(content, start, end)
                 
-                # Add to results
+                # Add to the page's results
                 result = SearchResult(
                     page=page,
                     content_snippet=snippet,
                     match_start=start,
                     match_end=end,
-                    relevance_score=page_score
+                    relevance_score=0.0
                 )
-                results.append(result)
+                page_results.append(result)
+            
+            # Search in the page name if requested
+            name_match = pattern.search(page.name) if include_page_names else None
+            
+            # Calculate page relevance score
+            page_score = len(page_results) * 1.0
+            if name_match:
+                page_score += 2.0  # Matches in titles are weighted more heavily
+            
+            for result in page_results:
+                result.relevance_score = page_score
+            results.extend(page_results)
             
             # Process name match if any
             if name_match:
@@ -241,25 +614,12 @@ class SearchEngine:
         # Search through all pages
         for page in self.notebook.pages.values():
             # Search in the page content
-            for match in regex.finditer(page.content):
+            content = page.content
+            for match in regex.finditer(content):
                 start, end = match.span()
                 
                 # Extract a snippet of context around the match
-                content_start = max(0, start - self.context_size)
-                content_end = min(len(page.content), end + self.context_size)
-                
-                # Create the content snippet
-                if content_start > 0:
-                    prefix = "..."
-                else:
-                    prefix = ""
-                    
-                if content_end < len(page.content):
-                    suffix = "..."
-                else:
-                    suffix = ""
-                    
-                snippet = prefix + page.content[content_start:content_end] + suffix
+                snippet = self._make_snippet(content, start, end)
                 
                 # Calculate a simple relevance score
                 score = 1.0
@@ -297,57 +657,68 @@ class SearchEngine:
         
         results = []
         
-        # Create patterns for each keyword
-        patterns = [re.compile(r'\b' + re.escape(kw) + r'\b', re.IGNORECASE) for kw in keywords]
+        # Match ASCII word keywords with one pattern and one pass over each
+        # page; their matches are whole words, so they never overlap and the
+        # pass sees every match of each keyword. Other keywords are matched
+        # with one pattern each
+        distinct = list(dict.fromkeys(kw.lower() for kw in keywords))
+        if keywords and all(kw.isascii() and _WORD_RE.fullmatch(kw) for kw in distinct):
+            combined = _keywords_pattern(tuple(distinct))
+            groups = [distinct.index(kw.lower()) for kw in keywords]
+            patterns = []
+        else:
+            combined = None
+            patterns = [_query_pattern(kw, False, True) for kw in keywords]
         
-        # Search through all pages
-        for page in self.notebook.pages.values():
-            # Check if all keywords are present
-            matches = []
-            match_all = True
+        # Search through the pages that may contain every keyword
+        for page in self._pages_to_search(" ".join(keywords), whole_words=True):
+            content = page.content
             
-            for pattern in patterns:
-                match = pattern.search(page.content)
-                if match:
+            if combined is not None:
+                # Count the matches of each keyword, keeping the first one
+                counts = [0] * len(distinct)
+                firsts: List[Optional[Match[str]]] = [None] * len(distinct)
+                for match in combined.finditer(content):
+                    group = match.lastindex - 1
+                    if not counts[group]:
+                        firsts[group] = match
+                    counts[group] += 1
+                
+                # Check if all keywords are present
+                if 0 in counts:
+                    continue
+                first_match = firsts[groups[0]]
+                keyword_count = sum(counts[group] for group in groups)
+            else:
+                # Check if all keywords are present
+                matches = []
+                for pattern in patterns:
+                    match = pattern.search(content)
+                    if not match:
+                        break
                     matches.append(match)
-                else:
-                    match_all = False
-                    break
-            
-            if match_all and matches:
-                # Calculate relevance based on keyword density
-                keyword_count = sum(len(list(p.finditer(page.content))) for p in patterns)
-                score = keyword_count / max(1, len(page.content.split()))
                 
-                # Extract a snippet around the first match
+                if not patterns or len(matches) < len(patterns):
+                    continue
                 first_match = matches[0]
-                start, end = first_match.span()
-                
-                # Create the content snippet
-                content_start = max(0, start - self.context_size)
-                content_end = min(len(page.content), end + self.context_size)
-                
-                if content_start > 0:
-                    prefix = "..."
-                else:
-                    prefix = ""
-                    
-                if content_end < len(page.content):
-                    suffix = "..."
-                else:
-                    suffix = ""
-                    
-                snippet = prefix + page.content[content_start:content_end] + suffix
-                
-                # Add to results
-                result = SearchResult(
-                    page=page,
-                    content_snippet=snippet,
-                    match_start=start,
-                    match_end=end,
-                    relevance_score=score
-                )
-                results.append(result)
+                keyword_count = sum(len(list(p.finditer(content))) for p in patterns)
+            
+            # Calculate relevance based on keyword density
+            score = keyword_count / max(1, len(content.split()))
+            
+            # Extract a snippet around the first match of the first keyword
+            start, end = first_match.span()
+            snippet = self._make_snippet(content, start, end)
+            
+            # Add to results
+            result = SearchResult(
+                page=page,
+                content_snippet=snippet,
+                match_start=start,
+                match_end=end,
+                relevance_score=score
+            )
+            results.append(result)
         
         # Sort by relevance score (descending)
         results.sort(key=lambda r: r.relevance_score, reverse=True)
@@ -68,6 +68,33 @@ def test_create_multiple_pages():
     assert 3 in notebook.pages
 
 
+def test_page_ids_are_not_reused():
+    """Test that deleting a page does not free its ID for new pages."""
+    notebook = Notebook()
+    
+    notebook.create_page(name="Page 1")
+    page2 = notebook.create_page(name="Page 2")
+    notebook.delete_page(page2.page_id)
+    page3 = notebook.create_page(name="Page 3")
+    
+    assert page3.page_id == 3
+
+
+def test_page_ids_continue_after_restore():
+    """Test that pages created after a restore get fresh IDs."""
+    notebook = Notebook()
+    notebook.create_page(name="Page 1")
+    notebook.create_page(name="Page 2")
+    
+    restored = Notebook.from_dict(notebook.to_dict())
+    page3 = restored.create_page(name="Page 3")
+    restored.pages[4] = Page(page_id=4, name="Page 4")
+    page5 = restored.create_page(name="Page 5")
+    
+    assert page3.page_id == 3
+    assert page5.page_id == 5
+
+
 def test_get_page():
     """Test that pages can be retrieved from the notebook."""
     notebook = Notebook()
@@ -132,6 +159,24 @@ def test_list_pages():
     assert pages[2] == page3
 
 
+def test_list_pages_stays_sorted_by_id():
+    """Test that pages are listed in ID order after deletes and restores."""
+    notebook = Notebook()
+    for i in range(5):
+        notebook.create_page(name=f"Page {i + 1}")
+    notebook.delete_page(2)
+    notebook.delete_page(5)
+    notebook.create_page(name="Page 6")
+    data = notebook.to_dict()
+    data["pages"] = dict(reversed(list(data["pages"].items())))
+    
+    restored = Notebook.from_dict(data)
+    restored.create_page(name="Page 7")
+    
+    assert [page.page_id for page in notebook.list_pages()] == [1, 3, 4, 6]
+    assert [page.page_id for page in restored.list_pages()] == [1, 3, 4, 6, 7]
+
+
 def test_search_pages():
     """Test that pages can be searched in the notebook."""
     notebook = Notebook()
@@ -150,6 +195,62 @@ def test_search_pages():
     assert results[0].name == "Apple Banana" or results[1].name == "Apple Banana"
 
 
+def test_search_pages_after_update():
+    """Test that search sees page content and names changed after a search."""
+    notebook = Notebook()
+    page = notebook.create_page(name="Fruit", content="Apples")
+    notebook.search_pages("apple")
+    
+    page.update_content("Cherries")
+    page.rename("Red Fruit")
+    
+    assert notebook.search_pages("apple") == []
+    assert notebook.search_pages("CHERRIES") == [page]
+    assert notebook.search_pages("red") == [page]
+
+
+def test_page_apply_delta():
+    """Test that page edits can be applied as replaced ranges."""
+    notebook = Notebook()
+    page = notebook.create_page(content="Hello world")
+    notebook.search_pages("world")
+    
+    page.apply_delta(6, 5, "there")
+    page.apply_delta(11, 0, "!")
+    page.apply_delta(0, 0, "Oh. ")
+    
+    assert page.content == "Oh. Hello there!"
+    assert notebook.search_pages("world") == []
+    assert page.updated_at >= page.created_at
+
+
+def test_timestamps_follow_modifications():
+    """Test that modifying a page or the notebook advances its update time."""
+    notebook = Notebook()
+    page = notebook.create_page(name="Page 1")
+    page.updated_at = notebook.updated_at = datetime(2000, 1, 1)
+    
+    page.update_content("New content")
+    notebook.set_metadata("author", "Tester")
+    
+    assert page.created_at <= page.updated_at
+    assert page.updated_at > datetime(2000, 1, 1)
+    assert notebook.updated_at > datetime(2000, 1, 1)
+
+
+def test_fast_serialize_matches_to_dict():
+    """Test that the fast serialization holds the same data as to_dict."""
+    notebook = Notebook(name="Test Notebook")
+    notebook.create_page(name="Page 1", content="First")
+    notebook.create_page(name="Page 2", content="Second")
+    
+    data = notebook.fast_serialize()
+    
+    assert data["created_at"] == notebook.created_at
+    assert [page["page_id"] for page in data["pages"]] == [1, 2]
+    assert data["pages"][1]["updated_at"].isoformat() == notebook.to_dict()["pages"]["2"]["updated_at"]
+
+
 def test_max_pages_limit():
     """Test that the notebook enforces the maximum page limit."""
     notebook = Notebook(max_pages=2)
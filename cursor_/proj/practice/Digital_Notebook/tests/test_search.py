@@ -6,7 +6,7 @@ This module contains tests for verifying the functionality of the Search module.
 import pytest
 import re
 
-from src.utils.search import SearchEngine, SearchResult
+from src.utils.search import SearchEngine, SearchResult, _query_pattern
 from src.core.notebook import Notebook
 from src.core.page import Page
 
@@ -167,4 +167,151 @@ def test_search_result_dataclass():
     assert result.page == page
     assert result.score == 0.85
     assert result.match_count == 2
-    assert result.contexts == ["context1", "context2"] 
\ No newline at end of file
+    assert result.contexts == ["context1", "context2"] 
+
+def test_prefix_search(sample_notebook):
+    """Test that prefix search matches whole words and a trailing prefix."""
+    search_engine = SearchEngine(sample_notebook)
+    
+    results = search_engine.prefix_search("python lib")
+    
+    assert [r.page.name for r in results] == ["Data Science", "Machine Learning"]
+    assert search_engine.prefix_search("python lib", limit=1)[0].page.name == "Data Science"
+    assert search_engine.prefix_search("pyth libraries") == []
+    assert search_engine.prefix_search("") == []
+
+
+def test_prefix_search_snippets(sample_notebook):
+    """Test that prefix search results show the first occurrence of the first word."""
+    search_engine = SearchEngine(sample_notebook)
+    
+    results = search_engine.prefix_search("DOMAIN")
+    
+    assert len(results) == 1
+    assert results[0].content_snippet.startswith("Data science combines domain")
+    assert results[0].match_start == sample_notebook.get_page(2).content.index("domain")
+
+
+def test_prefix_search_after_changes(sample_notebook):
+    """Test that invalidated pages are re-indexed before the next prefix search."""
+    search_engine = SearchEngine(sample_notebook)
+    search_engine.build_index()
+    
+    sample_notebook.get_page(1).update_content("Rewritten without the language name")
+    search_engine.invalidate_page(1)
+    page = sample_notebook.create_page(name="Python Notes")
+    search_engine.invalidate_page(page.page_id)
+    sample_notebook.delete_page(3)
+    search_engine.invalidate_page(3)
+    
+    results = search_engine.prefix_search("pyth")
+    
+    assert [r.page.page_id for r in results] == [1, 2, page.page_id]
+    assert results[0].content_snippet == "[Page Name]: Python Programming"
+    assert search_engine.prefix_search("scikit") == []
+
+
+def test_indexed_searches_match_full_scan(sample_notebook):
+    """Test that searches narrowed down by the index find what a full scan finds."""
+    search_engine = SearchEngine(sample_notebook)
+    search_engine.build_index()
+    
+    sample_notebook.get_page(2).update_content("Statistics with Kotlin")
+    search_engine.invalidate_page(2)
+    
+    assert [r.page.page_id for r in search_engine.basic_search("gram")] == [1, 1]
+    assert [r.page.page_id for r in search_engine.basic_search("kotlin")] == [2]
+    assert [r.page.page_id for r in search_engine.basic_search("ning is")] == [3]
+    assert [r.page.page_id for r in search_engine.search_by_keywords(["python", "learning"])] == [3]
+    assert search_engine.search_by_keywords(["program"]) == []
+    assert [r.page.page_id for r in search_engine.advanced_search("learn", whole_words=True)] == [3, 3]
+    assert [r.content_snippet for r in search_engine.advanced_search("Science")] == ["[Page Name]: Data Science"]
+    assert search_engine.advanced_search("Science", include_page_names=False) == []
+
+
+def test_index_follows_changes_without_invalidation(sample_notebook):
+    """Test that pages created, edited, renamed or deleted directly are searched as they are now."""
+    search_engine = SearchEngine(sample_notebook)
+    search_engine.basic_search("python")
+    
+    page = sample_notebook.create_page(name="Zoology", content="hello")
+    sample_notebook.get_page(1).update_content("zebra stripes")
+    sample_notebook.get_page(2).apply_delta(0, 0, "Quokka ")
+    sample_notebook.get_page(3).rename("Kotlin")
+    sample_notebook.delete_page(3)
+    
+    assert [r.page.page_id for r in search_engine.basic_search("hello")] == [page.page_id]
+    assert [r.page.page_id for r in search_engine.basic_search("zebra")] == [1]
+    assert [r.page.page_id for r in search_engine.search_by_keywords(["quokka", "python"])] == [2]
+    assert search_engine.search_by_keywords(["scikit"]) == []
+    assert search_engine.basic_search("programming language") == []
+    assert [r.page.page_id for r in search_engine.advanced_search("zebra")] == [1]
+    assert [r.content_snippet for r in search_engine.advanced_search("zoology")] == ["[Page Name]: Zoology"]
+    assert search_engine.advanced_search("kotlin") == []
+
+
+def test_prefix_search_is_memoized(sample_notebook):
+    """Test that repeated prefix searches are memoized until a page changes."""
+    search_engine = SearchEngine(sample_notebook)
+    
+    first = search_engine.prefix_search("Python lib")
+    second = search_engine.prefix_search("  python LIB ")
+    
+    assert [r.page.page_id for r in first] == [2, 3]
+    assert second == first
+    assert search_engine._cached_prefix_search.cache_info().hits == 1
+    
+    sample_notebook.get_page(2).update_content("No more libraries here")
+    search_engine.invalidate_page(2)
+    
+    assert [r.page.page_id for r in search_engine.prefix_search("python lib")] == [3]
+    
+    sample_notebook.get_page(3).update_content("No libraries here either")
+    sample_notebook.create_page(name="Python libraries")
+    
+    assert [r.page.page_id for r in search_engine.prefix_search("python lib")] == [4]
+
+
+def test_query_patterns_are_shared():
+    """Test that repeated queries reuse one compiled pattern per set of options."""
+    pattern = _query_pattern("a.b", False, True)
+    
+    assert _query_pattern("a.b", False, True) is pattern
+    assert _query_pattern("a.b", True, True) is not pattern
+    assert pattern.search("x A.B y") and not pattern.search("aXb") and not pattern.search("a.bc")
+
+
+def test_search_by_keywords_counts_every_keyword(sample_notebook):
+    """Test that keywords matched in one pass are counted like separately matched ones."""
+    search_engine = SearchEngine(sample_notebook)
+    
+    results = search_engine.search_by_keywords(["PYTHON", "python", "language"])
+    
+    assert sorted(r.page.page_id for r in results) == [1, 2]
+    for result in results:
+        content = result.page.content
+        expected = 2 * len(re.findall(r"\bpython\b", content, re.IGNORECASE)) + content.count("language")
+        assert result.relevance_score == expected / len(content.split())
+        assert content[result.match_start:result.match_end] == "Python"
+    assert search_engine.search_by_keywords(["python language", "python"]) == []
+
+
+def test_saved_index_reused_for_unchanged_pages(sample_notebook, tmp_path, monkeypatch):
+    """Test that a saved index is reused for the pages not modified since it was saved."""
+    index_path = str(tmp_path / "notebook.idx")
+    search_engine = SearchEngine(sample_notebook)
+    search_engine.build_index()
+    search_engine.save_index(index_path)
+    sample_notebook.get_page(2).update_content("Rewritten with Julia")
+    indexed = []
+    index_page = SearchEngine._index_page
+    monkeypatch.setattr(
+        SearchEngine, "_index_page", staticmethod(lambda page: indexed.append(page.page_id) or index_page(page))
+    )
+    
+    reloaded = SearchEngine(sample_notebook)
+    reloaded.build_index(index_path)
+    
+    assert indexed == [2]
+    assert [r.page.page_id for r in reloaded.prefix_search("jul")] == [2]
+    assert [r.page.page_id for r in reloaded.prefix_search("python")] == [1, 3]
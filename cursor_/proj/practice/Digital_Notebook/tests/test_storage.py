@@ -0,0 +1,350 @@
+"""
+Tests for the storage module.
+
+This module contains tests for verifying that notebooks are saved and loaded correctly.
+"""
+import pytest
+from sqlalchemy import select, text
+
+from src.core.notebook import Notebook
+from src.data import storage as storage_module
+from src.data.storage import NotebookStorage, PageRecord, _dispose_engine, _get_engine
+from src.utils.search import SearchEngine
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Create a storage manager in a temporary directory."""
+    return NotebookStorage(storage_dir=str(tmp_path))
+
+
+@pytest.fixture
+def notebook():
+    """Create a notebook with a few pages."""
+    notebook = Notebook(name="Test Notebook")
+    notebook.set_metadata("author", "Tester")
+    notebook.create_page(name="Page 1", content="First page")
+    notebook.create_page(name="Page 2", content="Second page")
+    notebook.get_page(2).set_metadata("tag", "draft")
+    return notebook
+
+
+def test_save_and_load(storage, notebook):
+    """Test that a saved notebook loads back with its pages."""
+    storage.save_notebook(notebook)
+    
+    loaded = storage.load_notebook("Test Notebook")
+    
+    assert loaded.name == "Test Notebook"
+    assert loaded.get_metadata("author") == "Tester"
+    assert [page.name for page in loaded.list_pages()] == ["Page 1", "Page 2"]
+    assert loaded.get_page(2).content == "Second page"
+    assert loaded.get_page(2).get_metadata("tag") == "draft"
+    assert loaded.get_page(1).updated_at == notebook.get_page(1).updated_at
+
+
+def test_long_content_round_trip(storage, notebook):
+    """Test that long pages are stored compressed and load unchanged."""
+    content = "All work and no play makes Jack a dull boy. \u2603\n" * 1000
+    notebook.get_page(1).update_content(content)
+    storage.save_notebook(notebook)
+    db_path = storage._get_db_path(notebook.name)
+    
+    with _get_engine(db_path).connect() as connection:
+        stored = connection.execute(text("SELECT page_id, typeof(content) FROM pages")).all()
+    loaded = storage.load_notebook("Test Notebook")
+    
+    assert dict(stored) == {1: "blob", 2: "text"}
+    assert loaded.get_page(1).content == content
+    assert loaded.get_page(2).content == "Second page"
+
+
+def test_metadata_round_trip(storage, notebook):
+    """Test that nested metadata survives saving and loading."""
+    notebook.set_metadata("settings", {"tags": ["a", "b"], "count": 2, "ratio": 0.5, "note": "caf\u00e9"})
+    notebook.set_metadata("ids", {1: True})
+    storage.save_notebook(notebook)
+    
+    loaded = storage.load_notebook("Test Notebook")
+    
+    assert loaded.get_metadata("settings") == notebook.get_metadata("settings")
+    assert loaded.get_metadata("ids") == {"1": True}
+
+
+def test_save_twice_replaces_pages(storage, notebook):
+    """Test that saving again stores the current pages only."""
+    storage.save_notebook(notebook)
+    notebook.delete_page(1)
+    notebook.get_page(2).update_content("Edited")
+    notebook.create_page(name="Page 3")
+    
+    storage.save_notebook(notebook)
+    loaded = storage.load_notebook("Test Notebook")
+    
+    assert list(loaded.pages) == [2, 3]
+    assert loaded.get_page(2).content == "Edited"
+
+
+def test_save_writes_only_changed_pages(storage, notebook):
+    """Test that saving again rewrites the rows of changed pages only."""
+    db_path = storage._get_db_path(notebook.name)
+    query = select(PageRecord.page_id, PageRecord.id)
+    
+    storage.save_notebook(notebook)
+    with _get_engine(db_path).connect() as connection:
+        before = dict(connection.execute(query).all())
+    notebook.get_page(1).rename("Renamed")
+    storage.save_notebook(notebook)
+    with _get_engine(db_path).connect() as connection:
+        after = dict(connection.execute(query).all())
+    
+    assert after[1] != before[1]
+    assert after[2] == before[2]
+    assert storage.load_notebook("Test Notebook").get_page(1).name == "Renamed"
+
+
+def test_save_notebook_async(storage, notebook):
+    """Test that background saves write the notebook as it was when submitted."""
+    storage.save_notebook_async(notebook)
+    notebook.get_page(1).update_content("Queued edit")
+    future = storage.save_notebook_async(notebook)
+    notebook.get_page(1).update_content("Unsaved edit")
+    
+    future.result(timeout=10)
+    loaded = storage.load_notebook("Test Notebook")
+    
+    assert loaded.get_page(1).content == "Queued edit"
+
+
+def test_page_content_read_on_first_use(storage, notebook):
+    """Test that loaded pages read their content only when it is first used."""
+    storage.save_notebook(notebook)
+    
+    loaded = storage.load_notebook("Test Notebook")
+    page = loaded.get_page(2)
+    
+    assert page.content_loader is not None
+    assert page.content == "Second page"
+    assert page.content_loader is None
+
+
+def test_indexing_leaves_page_content_unread(storage, notebook):
+    """Test that indexing a loaded notebook reads page contents without keeping them."""
+    storage.save_notebook(notebook)
+    loaded = storage.load_notebook("Test Notebook")
+    search_engine = SearchEngine(loaded)
+    
+    search_engine.build_index()
+    
+    assert all(page.content_loader is not None for page in loaded.list_pages())
+    assert search_engine.search_by_keywords(["second"])[0].page.page_id == 2
+
+
+def test_save_unread_pages_to_directory(storage, notebook, tmp_path):
+    """Test that pages whose content was never read are saved with their content."""
+    storage.save_notebook(notebook)
+    loaded = storage.load_notebook("Test Notebook")
+    directory = tmp_path / "elsewhere"
+    
+    storage.save_notebook_async(loaded, str(directory)).result(timeout=10)
+    copy = storage.load_notebook_from_file(str(directory / "Test Notebook.db"))
+    
+    assert [page.content for page in copy.list_pages()] == ["First page", "Second page"]
+
+
+def test_save_renamed_unread_page(storage, notebook):
+    """Test that a page renamed without reading its content is saved with its content."""
+    storage.save_notebook(notebook)
+    loaded = storage.load_notebook("Test Notebook")
+    loaded.get_page(2).rename("Renamed")
+    loaded.set_metadata("author", "Editor")
+    
+    storage.save_notebook(loaded)
+    db_path = storage._get_db_path("Test Notebook")
+    _dispose_engine(db_path)
+    reloaded = storage.load_notebook("Test Notebook")
+    
+    assert [(page.name, page.content) for page in reloaded.list_pages()] == [
+        ("Page 1", "First page"), ("Renamed", "Second page")
+    ]
+    assert reloaded.get_metadata("author") == "Editor"
+
+
+def test_unread_page_missing_from_database(storage, notebook):
+    """Test that reading a page removed from the database raises instead of returning nothing."""
+    storage.save_notebook(notebook)
+    loaded = storage.load_notebook("Test Notebook")
+    with _get_engine(storage._get_db_path("Test Notebook")).begin() as connection:
+        connection.execute(text("DELETE FROM pages WHERE page_id = 2"))
+    
+    with pytest.raises(LookupError):
+        loaded.get_page(2).content
+
+
+def test_save_notebook_async_to_directory(storage, notebook, tmp_path):
+    """Test that background saves can target a directory other than the storage directory."""
+    directory = tmp_path / "elsewhere"
+    
+    storage.save_notebook_async(notebook, str(directory)).result(timeout=10)
+    loaded = storage.load_notebook_from_file(str(directory / "Test Notebook.db"))
+    
+    assert loaded.get_page(2).get_metadata("tag") == "draft"
+    assert storage.load_notebook("Test Notebook") is None
+
+
+def test_save_notebook_as_async_with_new_name(storage, notebook, tmp_path):
+    """Test that background Save As renames only the saved copy and reports its path."""
+    directory = tmp_path / "elsewhere"
+    
+    file_path = storage.save_notebook_as_async(notebook, str(directory), "Renamed").result(timeout=10)
+    loaded = storage.load_notebook_from_file(file_path)
+    
+    assert file_path == str(directory / "Renamed.db")
+    assert loaded.name == "Renamed"
+    assert notebook.name == "Test Notebook"
+    assert storage.get_storage_directory() != str(directory)
+
+
+def test_save_unchanged_notebook_writes_nothing(storage, notebook, monkeypatch):
+    """Test that saving a notebook unchanged since it was saved or loaded skips the write."""
+    storage.save_notebook(notebook)
+    loaded = storage.load_notebook("Test Notebook")
+    writes = []
+    original_write = storage._write_snapshot
+    monkeypatch.setattr(storage, "_write_snapshot", lambda *args: writes.append(args) or original_write(*args))
+    
+    storage.save_notebook(notebook)
+    storage.save_notebook_async(loaded).result(timeout=10)
+    loaded.get_page(1).update_content("Changed")
+    storage.save_notebook(loaded)
+    
+    assert len(writes) == 1
+    assert storage.load_notebook("Test Notebook").get_page(1).content == "Changed"
+
+
+def test_is_saved(storage, notebook):
+    """Test that a notebook is reported as saved until it changes."""
+    db_path = storage._get_db_path(notebook.name)
+    
+    assert not storage.is_saved(notebook, db_path)
+    
+    storage.save_notebook(notebook)
+    loaded = storage.load_notebook("Test Notebook")
+    
+    assert storage.is_saved(notebook, db_path)
+    assert storage.is_saved(loaded, db_path)
+    
+    loaded.get_page(1).rename("Renamed")
+    
+    assert not storage.is_saved(loaded, db_path)
+
+
+def test_save_notebook_as_copies_saved_notebook(storage, notebook, tmp_path):
+    """Test that saving an unchanged notebook elsewhere copies its database."""
+    storage.save_notebook(notebook)
+    first_copy = storage.save_notebook_as(notebook, str(tmp_path / "first"))
+    notebook.get_page(1).update_content("Changed")
+    second_copy = storage.save_notebook_as(notebook, str(tmp_path / "second"))
+    
+    first = storage.load_notebook_from_file(first_copy)
+    second = storage.load_notebook_from_file(second_copy)
+    
+    assert first.get_page(1).content == "First page"
+    assert second.get_page(1).content == "Changed"
+    assert len(first.pages) == len(second.pages) == 2
+
+
+def test_pages_index_added_to_existing_database(storage, notebook):
+    """Test that saving to a database without the pages index creates it."""
+    storage.save_notebook(notebook)
+    db_path = storage._get_db_path(notebook.name)
+    with _get_engine(db_path).begin() as connection:
+        connection.execute(text("DROP INDEX ix_pages_nb_pid"))
+    _dispose_engine(db_path)
+    
+    storage.save_notebook(notebook)
+    with _get_engine(db_path).connect() as connection:
+        indexes = connection.execute(text("PRAGMA index_list(pages)")).all()
+    
+    assert "ix_pages_nb_pid" in [index[1] for index in indexes]
+
+
+def test_least_recently_used_database_closed(storage, notebook, monkeypatch):
+    """Test that opening more databases than are kept open closes the least recently used one."""
+    monkeypatch.setattr(storage_module, "_MAX_OPEN_DATABASES", 2)
+    storage.save_notebook(notebook)
+    db_path = storage._get_db_path("Test Notebook")
+    engine = _get_engine(db_path)
+    
+    for name in ("Other 1", "Other 2"):
+        storage.save_notebook(Notebook(name=name))
+    
+    assert db_path not in storage_module._databases
+    assert _get_engine(db_path) is not engine
+    assert storage.load_notebook("Test Notebook").get_page(2).content == "Second page"
+
+
+def test_delete_and_recreate(storage, notebook):
+    """Test that a deleted notebook can be saved again under the same name."""
+    storage.save_notebook(notebook)
+    
+    assert storage.delete_notebook("Test Notebook")
+    assert storage.load_notebook("Test Notebook") is None
+    
+    storage.save_notebook(notebook)
+    
+    assert len(storage.load_notebook("Test Notebook").pages) == 2
+
+
+def test_list_notebooks(storage, notebook, tmp_path):
+    """Test that only notebook database files are listed."""
+    storage.save_notebook(notebook)
+    (tmp_path / "notes.txt").write_text("not a notebook")
+    (tmp_path / "folder.db").mkdir()
+    
+    notebooks = storage.list_notebooks()
+    
+    assert notebooks == {"Test Notebook": str(tmp_path / "Test Notebook.db")}
+
+
+def test_load_missing_notebook(storage):
+    """Test that loading a notebook that was never saved returns None."""
+    assert storage.load_notebook("Missing") is None
+
+
+def test_load_invalid_file(storage, tmp_path):
+    """Test that loading a file that is not a notebook database returns None."""
+    path = tmp_path / "broken.db"
+    path.write_bytes(b"not a database" * 100)
+    
+    assert storage.load_notebook_from_file(str(path)) is None
+
+
+def test_delete_missing_notebook(storage):
+    """Test that deleting a notebook that was never saved returns False."""
+    assert not storage.delete_notebook("Missing")
+    assert storage.list_notebooks() == {}
+
+
+def test_transfer_includes_recent_saves(storage, notebook, tmp_path):
+    """Test that transferred notebooks contain changes still in the write-ahead log."""
+    storage.save_notebook(notebook)
+    notebook.create_page(name="Page 3")
+    storage.save_notebook(notebook)
+    target_dir = tmp_path / "target"
+    
+    transferred = storage.transfer_notebooks(storage.get_storage_directory(), str(target_dir))
+    loaded = storage.load_notebook_from_file(transferred["Test Notebook"])
+    
+    assert len(loaded.pages) == 3
+
+
+def test_set_storage_directory_creates_directory(storage, notebook, tmp_path):
+    """Test that switching to a new storage directory creates it."""
+    directory = tmp_path / "nested" / "notebooks"
+    
+    storage.set_storage_directory(str(directory))
+    storage.set_storage_directory(str(directory))
+    storage.save_notebook(notebook)
+    
+    assert (directory / "Test Notebook.db").exists()
@@ -0,0 +1,206 @@
+"""
+Tests for the text analysis module.
+
+This module contains tests for verifying the analysis WordCounter and TextAnalyzer classes.
+"""
+import re
+import string
+
+import pytest
+
+from src.analysis.text_analyzer import TextAnalyzer, TokenizedText
+from src.analysis.word_counter import WordCounter
+from src.core.page import Page
+
+
+SAMPLE_TEXTS = [
+    "",
+    "Hello world.",
+    "This is a simple sentence. And another one! Is this the third?",
+    "Numbers like 123 and symbols like !@#$ should be handled... properly.",
+    "snake_case_words, hyphen-ated words and don't contractions",
+    "Tabs\tand\nnewlines\r\nare whitespace too",
+    "Caf\u00e9 na\u00efve \u2014 r\u00e9sum\u00e9s aren't ASCII",
+]
+
+
+@pytest.fixture
+def analyzer():
+    """Create a text analyzer with a default word counter."""
+    return TextAnalyzer(WordCounter())
+
+
+def test_count_words_matches_regex_tokenizer():
+    """Test that word counts match the reference regex tokenizer."""
+    word_counter = WordCounter()
+    
+    for text in SAMPLE_TEXTS:
+        assert word_counter.count_words(text) == len(re.findall(r'\b\w+\b', text))
+
+
+def test_plot_data_matches_word_positions():
+    """Test that plot data has one point per word."""
+    word_counter = WordCounter()
+    text = "one two three four"
+    
+    data = word_counter.plot_data(text)
+    
+    assert data["x_values"] == [1, 2, 3, 4]
+    assert data["y_values"] == [1, 2, 3, 4]
+
+
+def test_sentence_count(analyzer):
+    """Test that sentences are split on terminal punctuation."""
+    text = "First sentence. Second sentence! Third sentence?"
+    
+    analysis = analyzer.analyze_text(text)
+    
+    assert analysis["sentence_count"] == len(re.split(r'[.!?]+', text))
+
+
+def test_analyze_text_keys(analyzer):
+    """Test that the analysis contains the expected metrics."""
+    analysis = analyzer.analyze_text(SAMPLE_TEXTS[2])
+    
+    assert analysis["word_count"] == 12
+    assert analysis["weighted_count"] == 12.0
+    assert "readability" in analysis
+    assert "keywords" in analysis
+    assert analysis["character_counts"]["total"] == len(SAMPLE_TEXTS[2])
+
+
+def test_analyze_text_is_memoized(analyzer):
+    """Test that repeated analyses are served from the cache."""
+    text = SAMPLE_TEXTS[2]
+    
+    first = analyzer.analyze_text(text)
+    first["word_count"] = -1
+    first["readability"].clear()
+    second = analyzer.analyze_text(text)
+    
+    assert analyzer._cached_analysis.cache_info().hits == 1
+    assert second["word_count"] == 12
+    assert second["readability"]
+
+
+def test_letter_weight_change_invalidates_cache():
+    """Test that changing the letter weight clears memoized analyses."""
+    word_counter = WordCounter(letter_weight=0.5)
+    before = word_counter.analyze_text("abc")
+    
+    word_counter.letter_weight = 1.0
+    after = word_counter.analyze_text("abc")
+    
+    assert before["character_weights"]["a"] == 0.5
+    assert after["character_weights"]["a"] == 1.0
+
+
+def test_character_weight_changes_reach_every_path():
+    """Test that a changed character weight is used for Latin-1 and other text alike."""
+    word_counter = WordCounter(letter_weight=0.5)
+    word_counter.get_character_weights("x!")
+    
+    word_counter.set_character_weight("!", 0.25)
+    
+    assert word_counter.get_character_weights("x!") == {"x": 0.5, "!": 0.25}
+    assert word_counter.get_character_weights("x!—") == {"x": 0.5, "!": 0.25, "—": 0.0}
+    with pytest.raises(TypeError):
+        word_counter.char_weights["!"] = 1.0
+
+
+def test_character_weight_change_invalidates_analyzer_cache():
+    """Test that TextAnalyzer does not serve analyses computed with old character weights."""
+    word_counter = WordCounter(letter_weight=0.5)
+    analyzer = TextAnalyzer(word_counter)
+    before = analyzer.analyze_text("a cat")
+    
+    word_counter.set_character_weight("a", 3.0)
+    after = analyzer.analyze_text("a cat")
+    
+    assert before["character_weights"]["a"] == 1.0
+    assert after["character_weights"]["a"] == 6.0
+
+
+def test_character_counts():
+    """Test that characters are counted by type."""
+    word_counter = WordCounter()
+    
+    counts = word_counter.analyze_text("Ab 12, c!\n")["character_counts"]
+    
+    assert counts == {
+        "letters": 3,
+        "digits": 2,
+        "punctuation": 2,
+        "whitespace": 3,
+        "total": 10,
+    }
+
+
+def test_count_syllables_matches_per_word_count(analyzer):
+    """Test that the vectorized syllable count matches counting word by word."""
+    texts = SAMPLE_TEXTS + ["The quick brown fox jumped over the lazy dog's bone."]
+    
+    for text in texts:
+        table = str.maketrans(string.punctuation, " " * len(string.punctuation))
+        words = text.lower().translate(table).split()
+        expected = sum(analyzer._count_syllables_in_word(word) for word in words)
+        assert analyzer._count_syllables(text) == expected
+
+
+def test_get_character_weights():
+    """Test that character weights are totalled per character."""
+    word_counter = WordCounter(letter_weight=0.5)
+    
+    assert word_counter.get_character_weights("aab, é") == {
+        "a": 1.0, "b": 0.5, ",": 0.0, " ": 0.0, "é": 0.0
+    }
+    assert word_counter.get_character_weights("a—a") == {"a": 1.0, "—": 0.0}
+
+
+def test_shared_tokens_match_standalone_analysis(analyzer):
+    """Test that precomputed tokens give the same results as tokenizing again."""
+    for text in SAMPLE_TEXTS:
+        tokens = TokenizedText.from_text(text)
+        
+        assert analyzer.extract_keywords(text, tokens=tokens) == analyzer.extract_keywords(text)
+        assert analyzer.calculate_readability(text, tokens=tokens) == analyzer.calculate_readability(text)
+
+
+def test_extract_keywords_slices_cached_ranking(analyzer):
+    """Test that keyword lists of different lengths come from one ranking."""
+    text = "apple banana apple cherry banana apple date elderberry fig grape"
+    
+    top_two = analyzer.extract_keywords(text, top_n=2)
+    top_five = analyzer.extract_keywords(text, top_n=5)
+    
+    assert top_two == ["apple", "banana"]
+    assert top_five == ["apple", "banana", "cherry", "date", "elderberry"]
+    assert analyzer._cached_keywords.cache_info().hits == 1
+
+
+def test_track_progress_accepts_pages(analyzer):
+    """Test that progress can be tracked over pages and plain strings alike."""
+    page = Page(page_id=1, content="one two three")
+    
+    first = analyzer.track_progress([page, "one two three four"])
+    page.update_content("one")
+    second = analyzer.track_progress([page])
+    
+    assert first["word_counts"] == [3, 4]
+    assert first["analyses"][0]["word_count"] == 3
+    assert second["word_counts"] == [1]
+
+
+def test_cached_word_count_follows_deltas():
+    """Test that a cached page word count is kept up to date by content deltas."""
+    word_counter = WordCounter()
+    page = Page(page_id=1, content="one two three")
+    word_counter.count_words_cached(page)
+    
+    page.apply_delta(3, 1, "")
+    page.apply_delta(6, 0, " and, four")
+    page.apply_delta(0, 0, "Café ")
+    
+    assert page.content == "Café onetwo and, four three"
+    assert page._cached_word_count == word_counter.count_words(page.content) == 5
+    assert word_counter.count_words_cached(page) == page.word_count() == 5